@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import pygame
 
@@ -12,215 +12,428 @@ BOARD_SIZE = 8
 WHITE = "white"
 BLACK = "black"
 
-
-@dataclass
+# Pieces are packed into one byte per square: bits 0-2 hold the type and
+# bit 3 the color, so the byte doubles as the piece's index into
+# ChessBoard.bitboards.
+EMPTY = 0
+PAWN = 1
+KNIGHT = 2
+BISHOP = 3
+ROOK = 4
+QUEEN = 5
+KING = 6
+TYPE_MASK = 7
+WHITE_BIT = 0
+BLACK_BIT = 8
+COLOR_MASK = 8
+PIECE_MASK = TYPE_MASK | COLOR_MASK
+
+COLOR_BITS = {WHITE: WHITE_BIT, BLACK: BLACK_BIT}
+
+# Squares are numbered 0-63 row by row from the top left (black's back rank).
+FILE = tuple(square % BOARD_SIZE for square in range(BOARD_SIZE * BOARD_SIZE))
+RANK = tuple(square // BOARD_SIZE for square in range(BOARD_SIZE * BOARD_SIZE))
+
+PIECE_SYMBOLS = {
+    PAWN | WHITE_BIT: "♙",
+    PAWN | BLACK_BIT: "♟",
+    ROOK | WHITE_BIT: "♖",
+    ROOK | BLACK_BIT: "♜",
+    KNIGHT | WHITE_BIT: "♘",
+    KNIGHT | BLACK_BIT: "♞",
+    BISHOP | WHITE_BIT: "♗",
+    BISHOP | BLACK_BIT: "♝",
+    QUEEN | WHITE_BIT: "♕",
+    QUEEN | BLACK_BIT: "♛",
+    KING | WHITE_BIT: "♔",
+    KING | BLACK_BIT: "♚",
+}
+
+
+# Hashable by value; frozen=True would route every field through
+# object.__setattr__ and make generating moves several times slower.
+@dataclass(slots=True, unsafe_hash=True)
 class Move:
-    start: Tuple[int, int]
-    end: Tuple[int, int]
-    promotion: Optional[str] = None
+    start: int
+    end: int
+    # Piece type to promote to, or EMPTY.
+    promotion: int = EMPTY
+
+
+class Undo(NamedTuple):
+    start: int
+    end: int
+    piece: int
+    captured: int
+
+
+def piece_color(piece: int) -> str:
+    return BLACK if piece & BLACK_BIT else WHITE
+
+
+KNIGHT_OFFSETS = (
+    (1, 2),
+    (2, 1),
+    (2, -1),
+    (1, -2),
+    (-1, -2),
+    (-2, -1),
+    (-2, 1),
+    (-1, 2),
+)
+KING_OFFSETS = (
+    (1, 0),
+    (1, 1),
+    (0, 1),
+    (-1, 1),
+    (-1, 0),
+    (-1, -1),
+    (0, -1),
+    (1, -1),
+)
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (-1, -1), (1, -1), (-1, 1))
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+
+
+def _square_of(x: int, y: int) -> int:
+    return y * BOARD_SIZE + x
+
+
+def _on_board(x: int, y: int) -> bool:
+    return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
+
+
+def _step_target_table(offsets) -> Tuple[Tuple[int, ...], ...]:
+    """Return, per square, the on-board squares reached by ``offsets``."""
+
+    table = []
+    for square in range(BOARD_SIZE * BOARD_SIZE):
+        x, y = FILE[square], RANK[square]
+        table.append(tuple(_square_of(x + dx, y + dy) for dx, dy in offsets if _on_board(x + dx, y + dy)))
+    return tuple(table)
+
+
+def _attack_masks(target_table) -> Tuple[int, ...]:
+    return tuple(sum(1 << target for target in targets) for targets in target_table)
+
+
+def _ray_table(dx: int, dy: int) -> Tuple[int, ...]:
+    table = []
+    for square in range(BOARD_SIZE * BOARD_SIZE):
+        x, y = FILE[square] + dx, RANK[square] + dy
+        mask = 0
+        while _on_board(x, y):
+            mask |= 1 << _square_of(x, y)
+            x += dx
+            y += dy
+        table.append(mask)
+    return tuple(table)
 
 
-class Piece:
-    def __init__(self, color: str):
-        self.color = color
-        self.has_moved = False
+KNIGHT_TARGETS = _step_target_table(KNIGHT_OFFSETS)
+KING_TARGETS = _step_target_table(KING_OFFSETS)
+KNIGHT_ATTACKS = _attack_masks(KNIGHT_TARGETS)
+KING_ATTACKS = _attack_masks(KING_TARGETS)
+# Squares a pawn of the given color attacks from each square.
+PAWN_ATTACKS = {
+    WHITE_BIT: _attack_masks(_step_target_table(((-1, -1), (1, -1)))),
+    BLACK_BIT: _attack_masks(_step_target_table(((-1, 1), (1, 1)))),
+}
+# One (ray table, ascending) pair per direction; ascending rays find their
+# first blocker in the lowest set bit, descending ones in the highest.
+ROOK_RAYS = tuple((_ray_table(dx, dy), dy > 0 or (dy == 0 and dx > 0)) for dx, dy in ROOK_DIRECTIONS)
+BISHOP_RAYS = tuple((_ray_table(dx, dy), dy > 0) for dx, dy in BISHOP_DIRECTIONS)
+QUEEN_RAYS = ROOK_RAYS + BISHOP_RAYS
 
-    def get_moves(self, board: "ChessBoard", pos: Tuple[int, int]) -> List[Move]:
-        raise NotImplementedError
 
-    def enemy_color(self):
-        return BLACK if self.color == WHITE else WHITE
+def _first_bit(bits: int, ascending: bool) -> int:
+    """Return the set bit of ``bits`` nearest to the start of a ray."""
 
+    return bits & -bits if ascending else 1 << (bits.bit_length() - 1)
 
-class Pawn(Piece):
-    def get_moves(self, board: "ChessBoard", pos: Tuple[int, int]) -> List[Move]:
-        moves = []
-        direction = -1 if self.color == WHITE else 1
-        start_row = 6 if self.color == WHITE else 1
-        x, y = pos
-        forward = (x, y + direction)
-        if board.is_empty(forward):
-            if forward[1] in (0, 7):
-                moves.append(Move(pos, forward, promotion="queen"))
-            else:
-                moves.append(Move(pos, forward))
-            two_forward = (x, y + 2 * direction)
-            if y == start_row and board.is_empty(two_forward):
-                moves.append(Move(pos, two_forward))
-        for dx in (-1, 1):
-            target = (x + dx, y + direction)
-            if board.is_enemy(target, self.color):
-                if target[1] in (0, 7):
-                    moves.append(Move(pos, target, promotion="queen"))
-                else:
-                    moves.append(Move(pos, target))
-        return moves
 
+def _slider_attacks(square: int, occupied: int, rays) -> int:
+    attacks = 0
+    for ray_table, ascending in rays:
+        ray = ray_table[square]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= ray_table[_first_bit(blockers, ascending).bit_length() - 1]
+        attacks |= ray
+    return attacks
 
-class Knight(Piece):
-    OFFSETS = [
-        (1, 2),
-        (2, 1),
-        (2, -1),
-        (1, -2),
-        (-1, -2),
-        (-2, -1),
-        (-2, 1),
-        (-1, 2),
-    ]
-
-    def get_moves(self, board: "ChessBoard", pos: Tuple[int, int]) -> List[Move]:
-        moves = []
-        x, y = pos
-        for dx, dy in self.OFFSETS:
-            target = (x + dx, y + dy)
-            if board.is_empty(target) or board.is_enemy(target, self.color):
-                moves.append(Move(pos, target))
-        return moves
 
+def _pawn_moves(board: "ChessBoard", square: int, out: List[Move], color: int, step: int, start_row: int):
+    squares = board.squares
+    forward = square + step
+    if not 0 <= forward < BOARD_SIZE * BOARD_SIZE:
+        return
+    promotion = QUEEN if RANK[forward] in (0, 7) else EMPTY
+    if not squares[forward]:
+        out.append(Move(square, forward, promotion))
+        if not promotion and RANK[square] == start_row and not squares[forward + step]:
+            out.append(Move(square, forward + step))
+    x = FILE[square]
+    for target, target_x in ((forward - 1, x - 1), (forward + 1, x + 1)):
+        if not 0 <= target_x < BOARD_SIZE:
+            continue
+        piece = squares[target]
+        if piece and piece & COLOR_MASK != color:
+            out.append(Move(square, target, promotion))
 
-class King(Piece):
-    OFFSETS = [
-        (1, 0),
-        (1, 1),
-        (0, 1),
-        (-1, 1),
-        (-1, 0),
-        (-1, -1),
-        (0, -1),
-        (1, -1),
-    ]
-
-    def get_moves(self, board: "ChessBoard", pos: Tuple[int, int]) -> List[Move]:
-        moves = []
-        x, y = pos
-        for dx, dy in self.OFFSETS:
-            target = (x + dx, y + dy)
-            if board.is_empty(target) or board.is_enemy(target, self.color):
-                moves.append(Move(pos, target))
-        # Castling omitted for simplicity
-        return moves
 
+def white_pawn_moves(board: "ChessBoard", square: int, out: List[Move]):
+    _pawn_moves(board, square, out, WHITE_BIT, -BOARD_SIZE, 6)
 
-class SlidingPiece(Piece):
-    DIRECTIONS: List[Tuple[int, int]] = []
-
-    def get_moves(self, board: "ChessBoard", pos: Tuple[int, int]) -> List[Move]:
-        moves = []
-        x, y = pos
-        for dx, dy in self.DIRECTIONS:
-            step = 1
-            while True:
-                target = (x + dx * step, y + dy * step)
-                if not board.is_on_board(target):
-                    break
-                if board.is_empty(target):
-                    moves.append(Move(pos, target))
-                elif board.is_enemy(target, self.color):
-                    moves.append(Move(pos, target))
-                    break
-                else:
-                    break
-                step += 1
-        return moves
+
+def black_pawn_moves(board: "ChessBoard", square: int, out: List[Move]):
+    _pawn_moves(board, square, out, BLACK_BIT, BOARD_SIZE, 1)
+
+
+def _step_moves(board: "ChessBoard", square: int, out: List[Move], target_table):
+    squares = board.squares
+    color = squares[square] & COLOR_MASK
+    for target in target_table[square]:
+        piece = squares[target]
+        if not piece or piece & COLOR_MASK != color:
+            out.append(Move(square, target))
+
+
+def _slide_moves(board: "ChessBoard", square: int, out: List[Move], rays):
+    bitboards = board.bitboards
+    color = board.squares[square] & COLOR_MASK
+    occupied = bitboards[WHITE_BIT] | bitboards[BLACK_BIT]
+    targets = _slider_attacks(square, occupied, rays) & ~bitboards[color]
+    while targets:
+        bit = targets & -targets
+        out.append(Move(square, bit.bit_length() - 1))
+        targets ^= bit
+
+
+def knight_moves(board: "ChessBoard", square: int, out: List[Move]):
+    _step_moves(board, square, out, KNIGHT_TARGETS)
+
+
+def king_moves(board: "ChessBoard", square: int, out: List[Move]):
+    # Castling omitted for simplicity
+    _step_moves(board, square, out, KING_TARGETS)
 
 
-class Rook(SlidingPiece):
-    DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+def bishop_moves(board: "ChessBoard", square: int, out: List[Move]):
+    _slide_moves(board, square, out, BISHOP_RAYS)
 
 
-class Bishop(SlidingPiece):
-    DIRECTIONS = [(1, 1), (-1, -1), (1, -1), (-1, 1)]
+def rook_moves(board: "ChessBoard", square: int, out: List[Move]):
+    _slide_moves(board, square, out, ROOK_RAYS)
 
 
-class Queen(SlidingPiece):
-    DIRECTIONS = Rook.DIRECTIONS + Bishop.DIRECTIONS
+def queen_moves(board: "ChessBoard", square: int, out: List[Move]):
+    _slide_moves(board, square, out, QUEEN_RAYS)
+
+
+# Indexed by packed piece (type | color); each generator appends the
+# piece's pseudo-legal moves to ``out``.
+def _move_gen_table() -> tuple:
+    table = [None] * (PIECE_MASK + 1)
+    for color_bit, pawn_gen in ((WHITE_BIT, white_pawn_moves), (BLACK_BIT, black_pawn_moves)):
+        table[PAWN | color_bit] = pawn_gen
+        table[KNIGHT | color_bit] = knight_moves
+        table[BISHOP | color_bit] = bishop_moves
+        table[ROOK | color_bit] = rook_moves
+        table[QUEEN | color_bit] = queen_moves
+        table[KING | color_bit] = king_moves
+    return tuple(table)
+
+
+MOVE_GEN = _move_gen_table()
 
 
 class ChessBoard:
     def __init__(self):
-        self.board: List[List[Optional[Piece]]] = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        self.squares = bytearray(BOARD_SIZE * BOARD_SIZE)
+        # Indexed by packed piece (type | color).  The unused type-0 slots,
+        # WHITE_BIT and BLACK_BIT, hold each side's combined occupancy.
+        self.bitboards = [0] * (PIECE_MASK + 1)
+        # Legal moves per color for the current position; cleared by move_piece.
+        self._legal_cache: Dict[str, List[Move]] = {}
         self.setup()
 
     def setup(self):
-        for i in range(BOARD_SIZE):
-            self.board[1][i] = Pawn(BLACK)
-            self.board[6][i] = Pawn(WHITE)
-        placement = [Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook]
-        for i, piece_cls in enumerate(placement):
-            self.board[0][i] = piece_cls(BLACK)
-            self.board[7][i] = piece_cls(WHITE)
+        back_rank = (ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK)
+        for i, piece_type in enumerate(back_rank):
+            self.squares[i] = piece_type | BLACK_BIT
+            self.squares[BOARD_SIZE + i] = PAWN | BLACK_BIT
+            self.squares[6 * BOARD_SIZE + i] = PAWN | WHITE_BIT
+            self.squares[7 * BOARD_SIZE + i] = piece_type | WHITE_BIT
+        self.bitboards = [0] * (PIECE_MASK + 1)
+        for square, piece in enumerate(self.squares):
+            if piece:
+                self.bitboards[piece & PIECE_MASK] |= 1 << square
+                self.bitboards[piece & COLOR_MASK] |= 1 << square
 
     def clone(self) -> "ChessBoard":
         new_board = ChessBoard.__new__(ChessBoard)
-        new_board.board = [[piece if piece is None else type(piece)(piece.color) for piece in row] for row in self.board]
+        new_board.squares = self.squares[:]
+        new_board.bitboards = self.bitboards[:]
+        new_board._legal_cache = {}
         return new_board
 
-    def is_on_board(self, pos: Tuple[int, int]) -> bool:
-        x, y = pos
-        return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
+    def is_on_board(self, square: int) -> bool:
+        return 0 <= square < BOARD_SIZE * BOARD_SIZE
 
-    def get(self, pos: Tuple[int, int]) -> Optional[Piece]:
-        if not self.is_on_board(pos):
-            return None
-        x, y = pos
-        return self.board[y][x]
+    def get(self, square: int) -> int:
+        if not self.is_on_board(square):
+            return EMPTY
+        return self.squares[square]
 
-    def is_empty(self, pos: Tuple[int, int]) -> bool:
-        return self.is_on_board(pos) and self.get(pos) is None
+    def is_empty(self, square: int) -> bool:
+        return self.is_on_board(square) and not self.squares[square]
 
-    def is_enemy(self, pos: Tuple[int, int], color: str) -> bool:
-        piece = self.get(pos)
-        return piece is not None and piece.color != color
+    def is_enemy(self, square: int, color: str) -> bool:
+        piece = self.get(square)
+        return bool(piece) and piece & COLOR_MASK != COLOR_BITS[color]
 
     def move_piece(self, move: Move):
-        start_x, start_y = move.start
-        end_x, end_y = move.end
-        piece = self.board[start_y][start_x]
-        self.board[start_y][start_x] = None
-        if move.promotion and isinstance(piece, Pawn):
-            promoted_cls = {"queen": Queen}[move.promotion]
-            piece = promoted_cls(piece.color)
-        self.board[end_y][end_x] = piece
-        if piece:
-            piece.has_moved = True
-
-    def find_king(self, color: str) -> Optional[Tuple[int, int]]:
-        for y in range(BOARD_SIZE):
-            for x in range(BOARD_SIZE):
-                piece = self.board[y][x]
-                if isinstance(piece, King) and piece.color == color:
-                    return (x, y)
-        return None
+        self._legal_cache.clear()
+        self.make_move(move)
+
+    def make_move(self, move: Move) -> Undo:
+        """Play ``move`` and return what :meth:`unmake_move` needs to take it back.
+
+        Unlike :meth:`move_piece` this keeps the legal-move cache, so every
+        call must be paired with ``unmake_move``.
+        """
+
+        squares = self.squares
+        bitboards = self.bitboards
+        start = move.start
+        end = move.end
+        start_bit = 1 << start
+        end_bit = 1 << end
+        piece = squares[start]
+        captured = squares[end]
+        if captured:
+            bitboards[captured & PIECE_MASK] ^= end_bit
+            bitboards[captured & COLOR_MASK] ^= end_bit
+        bitboards[piece & PIECE_MASK] ^= start_bit
+        bitboards[piece & COLOR_MASK] ^= start_bit | end_bit
+        moved = piece
+        if move.promotion and piece & TYPE_MASK == PAWN:
+            moved = move.promotion | (piece & COLOR_MASK)
+        bitboards[moved & PIECE_MASK] ^= end_bit
+        squares[start] = EMPTY
+        squares[end] = moved
+        return Undo(start, end, piece, captured)
+
+    def unmake_move(self, undo: Undo):
+        squares = self.squares
+        bitboards = self.bitboards
+        start, end, piece, captured = undo
+        start_bit = 1 << start
+        end_bit = 1 << end
+        bitboards[squares[end] & PIECE_MASK] ^= end_bit
+        bitboards[piece & PIECE_MASK] ^= start_bit
+        bitboards[piece & COLOR_MASK] ^= start_bit | end_bit
+        if captured:
+            bitboards[captured & PIECE_MASK] ^= end_bit
+            bitboards[captured & COLOR_MASK] ^= end_bit
+        squares[start] = piece
+        squares[end] = captured
+
+    def find_king(self, color: str) -> Optional[int]:
+        king_bits = self.bitboards[KING | COLOR_BITS[color]]
+        if not king_bits:
+            return None
+        return king_bits.bit_length() - 1
+
+    def is_attacked(self, square: int, attacker: int, occupied: Optional[int] = None) -> bool:
+        """Return ``True`` if any piece of color bit ``attacker`` hits ``square``.
+
+        ``occupied`` overrides the blockers seen by sliding pieces.
+        """
+
+        bitboards = self.bitboards
+        if KNIGHT_ATTACKS[square] & bitboards[KNIGHT | attacker]:
+            return True
+        if KING_ATTACKS[square] & bitboards[KING | attacker]:
+            return True
+        # A pawn attacks ``square`` exactly when a defending pawn there would attack it back.
+        if PAWN_ATTACKS[attacker ^ COLOR_MASK][square] & bitboards[PAWN | attacker]:
+            return True
+        if occupied is None:
+            occupied = bitboards[WHITE_BIT] | bitboards[BLACK_BIT]
+        queens = bitboards[QUEEN | attacker]
+        if _slider_attacks(square, occupied, BISHOP_RAYS) & (bitboards[BISHOP | attacker] | queens):
+            return True
+        return bool(_slider_attacks(square, occupied, ROOK_RAYS) & (bitboards[ROOK | attacker] | queens))
 
     def in_check(self, color: str) -> bool:
-        king_pos = self.find_king(color)
-        if not king_pos:
+        color_bit = COLOR_BITS[color]
+        king_bits = self.bitboards[KING | color_bit]
+        if not king_bits:
             return False
-        for y in range(BOARD_SIZE):
-            for x in range(BOARD_SIZE):
-                piece = self.board[y][x]
-                if piece and piece.color != color:
-                    for move in piece.get_moves(self, (x, y)):
-                        if move.end == king_pos:
-                            return True
-        return False
+        return self.is_attacked(king_bits.bit_length() - 1, color_bit ^ COLOR_MASK)
+
+    def pinned_pieces(self, color_bit: int) -> int:
+        """Return a bitboard of the pieces pinned against the king of ``color_bit``."""
+
+        bitboards = self.bitboards
+        king_bits = bitboards[KING | color_bit]
+        if not king_bits:
+            return 0
+        king_square = king_bits.bit_length() - 1
+        enemy = color_bit ^ COLOR_MASK
+        own = bitboards[color_bit]
+        occupied = own | bitboards[enemy]
+        queens = bitboards[QUEEN | enemy]
+        pinned = 0
+        for rays, sliders in (
+            (ROOK_RAYS, bitboards[ROOK | enemy] | queens),
+            (BISHOP_RAYS, bitboards[BISHOP | enemy] | queens),
+        ):
+            for ray_table, ascending in rays:
+                ray = ray_table[king_square]
+                if not ray & sliders:
+                    continue
+                blockers = ray & occupied
+                first = _first_bit(blockers, ascending)
+                rest = blockers ^ first
+                if first & own and rest and _first_bit(rest, ascending) & sliders:
+                    pinned |= first
+        return pinned
 
     def legal_moves(self, color: str) -> List[Move]:
+        cached = self._legal_cache.get(color)
+        if cached is not None:
+            return cached
         moves: List[Move] = []
-        for y in range(BOARD_SIZE):
-            for x in range(BOARD_SIZE):
-                piece = self.board[y][x]
-                if piece and piece.color == color:
-                    for move in piece.get_moves(self, (x, y)):
-                        if not self._move_puts_in_check(move, color):
-                            moves.append(move)
+        color_bit = COLOR_BITS[color]
+        enemy = color_bit ^ COLOR_MASK
+        king_bits = self.bitboards[KING | color_bit]
+        # Only moves out of check, king moves and moves of pinned pieces can
+        # expose the king; everything else is legal as generated.
+        in_check = self.in_check(color)
+        pinned = 0 if in_check else self.pinned_pieces(color_bit)
+        occupied_without_king = (self.bitboards[WHITE_BIT] | self.bitboards[BLACK_BIT]) ^ king_bits
+        for square, piece in enumerate(self.squares):
+            if piece and piece & COLOR_MASK == color_bit:
+                first = len(moves)
+                MOVE_GEN[piece](self, square, moves)
+                if piece & TYPE_MASK == KING:
+                    moves[first:] = [
+                        move for move in moves[first:] if not self.is_attacked(move.end, enemy, occupied_without_king)
+                    ]
+                elif in_check or pinned >> square & 1:
+                    moves[first:] = [move for move in moves[first:] if not self._move_puts_in_check(move, color)]
+        self._legal_cache[color] = moves
         return moves
 
     def _move_puts_in_check(self, move: Move, color: str) -> bool:
-        board_copy = self.clone()
-        board_copy.move_piece(move)
-        return board_copy.in_check(color)
+        undo = self.make_move(move)
+        in_check = self.in_check(color)
+        self.unmake_move(undo)
+        return in_check
 
 
 class ChessGame:
@@ -229,14 +442,38 @@ class ChessGame:
         self.font = font
         self.board = ChessBoard()
         self.turn = WHITE
-        self.selected: Optional[Tuple[int, int]] = None
-        self.valid_moves: List[Tuple[int, int]] = []
+        self.selected: Optional[int] = None
+        self.valid_moves: List[int] = []
         self.winner: Optional[str] = None
         self.back_button = BackButton(font, go_back)
         self.board_size = min(screen.get_height() * 0.8, screen.get_width() * 0.8)
         self.square_size = self.board_size / BOARD_SIZE
         self.offset_x = (screen.get_width() - self.board_size) / 2
         self.offset_y = (screen.get_height() - self.board_size) / 2
+        self.board_rect = pygame.Rect(self.offset_x, self.offset_y, self.board_size, self.board_size)
+        self._board_surface = self._render_board_surface()
+        self._piece_surfaces = self._render_piece_surfaces()
+
+    def _square_rect(self, square: int) -> pygame.Rect:
+        return pygame.Rect(
+            self.offset_x + FILE[square] * self.square_size,
+            self.offset_y + RANK[square] * self.square_size,
+            self.square_size,
+            self.square_size,
+        )
+
+    def _render_board_surface(self) -> pygame.Surface:
+        colors = [(240, 240, 255), (90, 130, 200)]
+        board_surface = pygame.Surface(self.board_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(board_surface, (5, 5, 35, 200), board_surface.get_rect(), border_radius=24)
+        for square in range(BOARD_SIZE * BOARD_SIZE):
+            rect = self._square_rect(square).move(-self.board_rect.x, -self.board_rect.y)
+            pygame.draw.rect(board_surface, colors[(FILE[square] + RANK[square]) % 2], rect)
+        return board_surface.convert_alpha()
+
+    def _render_piece_surfaces(self) -> Dict[int, pygame.Surface]:
+        piece_font = pygame.font.SysFont("arial", int(self.square_size * 0.8))
+        return {piece: piece_font.render(symbol, True, (10, 10, 10)).convert_alpha() for piece, symbol in PIECE_SYMBOLS.items()}
 
     def handle_events(self, events):
         for event in events:
@@ -246,28 +483,28 @@ class ChessGame:
                 if self.offset_x <= mx <= self.offset_x + self.board_size and self.offset_y <= my <= self.offset_y + self.board_size:
                     col = int((mx - self.offset_x) // self.square_size)
                     row = int((my - self.offset_y) // self.square_size)
-                    self.process_click((col, row))
+                    self.process_click(row * BOARD_SIZE + col)
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_r:
                 self.reset()
 
-    def process_click(self, pos: Tuple[int, int]):
-        if self.selected and pos in self.valid_moves:
-            self.make_move(Move(self.selected, pos))
+    def process_click(self, square: int):
+        if self.selected is not None and square in self.valid_moves:
+            self.make_move(Move(self.selected, square))
             self.selected = None
             self.valid_moves = []
             return
-        piece = self.board.get(pos)
-        if piece and piece.color == self.turn:
-            self.selected = pos
-            self.valid_moves = [move.end for move in piece.get_moves(self.board, pos) if not self.board._move_puts_in_check(move, self.turn)]
+        piece = self.board.get(square)
+        if piece and piece_color(piece) == self.turn:
+            self.selected = square
+            self.valid_moves = [move.end for move in self.board.legal_moves(self.turn) if move.start == square]
         else:
             self.selected = None
             self.valid_moves = []
 
     def make_move(self, move: Move):
         piece = self.board.get(move.start)
-        if isinstance(piece, Pawn) and (move.end[1] == 0 or move.end[1] == 7):
-            move = Move(move.start, move.end, promotion="queen")
+        if piece & TYPE_MASK == PAWN and RANK[move.end] in (0, 7):
+            move = Move(move.start, move.end, QUEEN)
         self.board.move_piece(move)
         self.turn = BLACK if self.turn == WHITE else WHITE
         if not self.board.legal_moves(self.turn):
@@ -287,51 +524,26 @@ class ChessGame:
         pass
 
     def draw_board(self):
-        colors = [(240, 240, 255), (90, 130, 200)]
-        board_rect = pygame.Rect(self.offset_x, self.offset_y, self.board_size, self.board_size)
-        board_surface = pygame.Surface(board_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(board_surface, (5, 5, 35, 200), board_surface.get_rect(), border_radius=24)
-        self.screen.blit(board_surface, board_rect.topleft)
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                color = colors[(row + col) % 2]
-                rect = pygame.Rect(
-                    self.offset_x + col * self.square_size,
-                    self.offset_y + row * self.square_size,
-                    self.square_size,
-                    self.square_size,
+        self.screen.blit(self._board_surface, self.board_rect.topleft)
+        for square in self.valid_moves:
+            if square != self.selected:
+                pygame.draw.circle(
+                    self.screen,
+                    (0, 0, 0),
+                    self._square_rect(square).center,
+                    self.square_size / 6,
+                    width=0,
                 )
-                pygame.draw.rect(self.screen, color, rect)
-                if self.selected == (col, row):
-                    pygame.draw.rect(self.screen, NEON_PINK, rect, 5)
-                elif (col, row) in self.valid_moves:
-                    pygame.draw.circle(
-                        self.screen,
-                        (0, 0, 0),
-                        rect.center,
-                        self.square_size / 6,
-                        width=0,
-                    )
+        if self.selected is not None:
+            pygame.draw.rect(self.screen, NEON_PINK, self._square_rect(self.selected), 5)
 
     def draw_pieces(self):
-        piece_symbols = {
-            Pawn: {WHITE: "♙", BLACK: "♟"},
-            Rook: {WHITE: "♖", BLACK: "♜"},
-            Knight: {WHITE: "♘", BLACK: "♞"},
-            Bishop: {WHITE: "♗", BLACK: "♝"},
-            Queen: {WHITE: "♕", BLACK: "♛"},
-            King: {WHITE: "♔", BLACK: "♚"},
-        }
-        piece_font = pygame.font.SysFont("arial", int(self.square_size * 0.8))
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                piece = self.board.board[row][col]
-                if piece:
-                    symbol = piece_symbols[type(piece)][piece.color]
-                    text = piece_font.render(symbol, True, (10, 10, 10))
-                    rect = text.get_rect(center=(self.offset_x + col * self.square_size + self.square_size / 2,
-                                                 self.offset_y + row * self.square_size + self.square_size / 2))
-                    self.screen.blit(text, rect)
+        for square, piece in enumerate(self.board.squares):
+            if piece:
+                text = self._piece_surfaces[piece & PIECE_MASK]
+                rect = text.get_rect(center=(self.offset_x + FILE[square] * self.square_size + self.square_size / 2,
+                                             self.offset_y + RANK[square] * self.square_size + self.square_size / 2))
+                self.screen.blit(text, rect)
 
     def draw_status(self):
         panel_height = 180
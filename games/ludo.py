@@ -1,56 +1,57 @@
 import random
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
 
 import pygame
 
-from .theme import NEON_PINK, draw_neon_background, draw_panel
+from .theme import NEON_PINK, blit_panel, draw_neon_background, render_panel_text
 from .ui import BackButton, Button
 
+HOME_PROGRESS = -1
+DIE_FACES = (1, 2, 3, 4, 5, 6)
 
-@dataclass
-class Token:
-    index: int
-    progress: int = -1  # -1 = home
-    finished_order: Optional[int] = None
 
-    def is_home(self) -> bool:
-        return self.progress == -1
+def _player_paths(path, start_indices):
+    """Return, per player, the track index and grid coordinate for each progress step."""
 
-    def is_finished(self, path_length: int, goal_length: int) -> bool:
-        return self.progress == path_length + goal_length
+    indices = tuple(tuple((start + progress) % len(path) for progress in range(len(path))) for start in start_indices)
+    coords = tuple(tuple(path[index] for index in row) for row in indices)
+    return indices, coords
 
 
 class LudoGame:
-    COLORS = [(220, 60, 60), (60, 200, 60), (250, 210, 70), (80, 140, 255)]
-    PLAYER_NAMES = ["Rot", "Grün", "Gelb", "Blau"]
-    PATH = [
+    COLORS = ((220, 60, 60), (60, 200, 60), (250, 210, 70), (80, 140, 255))
+    PLAYER_NAMES = ("Rot", "Grün", "Gelb", "Blau")
+    PATH = (
         (6, 13), (6, 12), (6, 11), (6, 10), (6, 9), (5, 8), (4, 8), (3, 8), (2, 8), (1, 8), (0, 8),
         (0, 7), (0, 6), (1, 6), (2, 6), (3, 6), (4, 6), (5, 5), (6, 5), (6, 4), (6, 3), (6, 2),
         (6, 1), (6, 0), (7, 0), (8, 0), (8, 1), (8, 2), (8, 3), (8, 4), (8, 5), (9, 6), (10, 6),
         (11, 6), (12, 6), (13, 6), (14, 6), (14, 7), (14, 8), (13, 8), (12, 8), (11, 8), (10, 8),
         (9, 9), (8, 9), (8, 10), (8, 11), (8, 12), (8, 13), (8, 14), (7, 14), (7, 13), (7, 12),
         (7, 11), (7, 10), (7, 9)
-    ]
-    START_INDICES = [0, 14, 28, 42]
-    HOME_POSITIONS = [
-        [(1, 10), (3, 10), (1, 12), (3, 12)],
-        [(1, 1), (3, 1), (1, 3), (3, 3)],
-        [(10, 1), (12, 1), (10, 3), (12, 3)],
-        [(10, 10), (12, 10), (10, 12), (12, 12)],
-    ]
-    GOAL_PATHS = [
-        [(6, 12), (6, 11), (6, 10), (6, 9)],
-        [(2, 6), (3, 6), (4, 6), (5, 6)],
-        [(8, 2), (8, 3), (8, 4), (8, 5)],
-        [(12, 8), (11, 8), (10, 8), (9, 8)],
-    ]
-    FINISH_POSITIONS = [
-        [(6.2, 7.8), (6.6, 7.8), (6.2, 7.4), (6.6, 7.4)],
-        [(7.4, 6.2), (7.8, 6.2), (7.4, 6.6), (7.8, 6.6)],
-        [(7.4, 7.8), (7.8, 7.8), (7.4, 7.4), (7.8, 7.4)],
-        [(6.2, 6.2), (6.6, 6.2), (6.2, 6.6), (6.6, 6.6)],
-    ]
+    )
+    START_INDICES = (0, 14, 28, 42)
+    PLAYER_PATH_INDEX, PLAYER_PATH_COORDS = _player_paths(PATH, START_INDICES)
+    HOME_POSITIONS = (
+        ((1, 10), (3, 10), (1, 12), (3, 12)),
+        ((1, 1), (3, 1), (1, 3), (3, 3)),
+        ((10, 1), (12, 1), (10, 3), (12, 3)),
+        ((10, 10), (12, 10), (10, 12), (12, 12)),
+    )
+    GOAL_PATHS = (
+        ((6, 12), (6, 11), (6, 10), (6, 9)),
+        ((2, 6), (3, 6), (4, 6), (5, 6)),
+        ((8, 2), (8, 3), (8, 4), (8, 5)),
+        ((12, 8), (11, 8), (10, 8), (9, 8)),
+    )
+    PATH_LENGTH = len(PATH)
+    GOAL_LENGTH = len(GOAL_PATHS[0])
+    FINISH_POSITIONS = (
+        ((6.2, 7.8), (6.6, 7.8), (6.2, 7.4), (6.6, 7.4)),
+        ((7.4, 6.2), (7.8, 6.2), (7.4, 6.6), (7.8, 6.6)),
+        ((7.4, 7.8), (7.8, 7.8), (7.4, 7.4), (7.8, 7.4)),
+        ((6.2, 6.2), (6.6, 6.2), (6.2, 6.6), (6.6, 6.6)),
+    )
 
     def __init__(self, screen: pygame.Surface, font: pygame.font.Font, go_back):
         self.screen = screen
@@ -59,15 +60,31 @@ class LudoGame:
         self.cell_size = self.board_size / 15
         self.offset_x = (screen.get_width() - self.board_size) / 2
         self.offset_y = (screen.get_height() - self.board_size) / 2
+        self._finish_progress = self.PATH_LENGTH + self.GOAL_LENGTH
+        self._click_radius_sq = (self.cell_size * 0.4) ** 2
+        self._rebuild_geometry()
+        self._board_surface = self._render_board_surface()
+        self._render_token_sprites()
 
-        self.tokens: List[List[Token]] = [[Token(i) for i in range(4)] for _ in range(4)]
+        # Token state, indexed [player][token index].
+        self.progress: List[List[int]] = [[HOME_PROGRESS] * 4 for _ in range(4)]
+        self.finished_order: List[List[Optional[int]]] = [[None] * 4 for _ in range(4)]
+        # Board index -> (player, token index) of the token standing there.
+        self.board_occupancy: Dict[int, Tuple[int, int]] = {}
+        # Per player, bit k is set while one of their tokens is on goal slot k
+        # (slot GOAL_LENGTH being the finish).
+        self._goal_occupancy_mask = [0, 0, 0, 0]
+        self._recompute_all_token_pos()
         self.finished_count = [0, 0, 0, 0]
         self.current_player = 0
         self.dice_value: Optional[int] = None
+        self._dice_buffer: Deque[int] = deque()
         self.awaiting_roll = True
         self.movable_tokens: List[int] = []
         self.message = ""
         self.winner: Optional[int] = None
+        # The HUD text is re-rendered only after the state it shows changes.
+        self._hud_dirty = True
 
         self.back_button = BackButton(font, go_back)
         button_rect = (
@@ -78,117 +95,123 @@ class LudoGame:
         )
         self.roll_button = Button(button_rect, "Würfeln", font, self.roll_dice)
 
-    @property
-    def path_length(self) -> int:
-        return len(self.PATH)
-
-    @property
-    def goal_length(self) -> int:
-        return len(self.GOAL_PATHS[0])
-
-    def grid_to_pixel(self, grid: Tuple[float, float]) -> Tuple[float, float]:
+    def grid_to_pixel(self, grid: Tuple[float, float]) -> Tuple[int, int]:
         x, y = grid
+        # Truncate once here, the same way pygame would when drawing.
         return (
-            self.offset_x + (x + 0.5) * self.cell_size,
-            self.offset_y + (y + 0.5) * self.cell_size,
+            int(self.offset_x + (x + 0.5) * self.cell_size),
+            int(self.offset_y + (y + 0.5) * self.cell_size),
         )
 
     def roll_dice(self):
         if not self.awaiting_roll or self.winner is not None:
             return
-        self.dice_value = random.randint(1, 6)
+        self._hud_dirty = True
+        if not self._dice_buffer:
+            self._dice_buffer.extend(random.choices(DIE_FACES, k=256))
+        self.dice_value = self._dice_buffer.popleft()
         self.awaiting_roll = False
         self.message = f"{self.PLAYER_NAMES[self.current_player]} würfelt eine {self.dice_value}"
-        self.movable_tokens = [i for i in range(4) if self.can_move(self.current_player, i, self.dice_value)]
+        self.movable_tokens = self._compute_movable(self.current_player, self.dice_value)
         if not self.movable_tokens:
             self.message += " - keine Züge möglich"
             self.next_player()
 
     def token_at_board_index(self, index: int) -> Optional[Tuple[int, int]]:
-        for player in range(4):
-            for token_index, token in enumerate(self.tokens[player]):
-                if 0 <= token.progress < self.path_length:
-                    board_index = (self.START_INDICES[player] + token.progress) % self.path_length
-                    if board_index == index:
-                        return player, token_index
-        return None
+        return self.board_occupancy.get(index)
+
+    def _set_progress(self, player: int, token_index: int, progress: int):
+        """Move a token to ``progress``, keeping ``board_occupancy`` and the
+        cached screen position in sync.
+
+        This is the only place that may assign ``self.progress``; set
+        ``finished_order`` before calling it.
+        """
+
+        player_progress = self.progress[player]
+        old = player_progress[token_index]
+        if 0 <= old < self.PATH_LENGTH:
+            del self.board_occupancy[self.PLAYER_PATH_INDEX[player][old]]
+        elif old >= self.PATH_LENGTH:
+            self._goal_occupancy_mask[player] &= ~(1 << (old - self.PATH_LENGTH))
+        player_progress[token_index] = progress
+        if 0 <= progress < self.PATH_LENGTH:
+            self.board_occupancy[self.PLAYER_PATH_INDEX[player][progress]] = (player, token_index)
+        elif progress >= self.PATH_LENGTH:
+            self._goal_occupancy_mask[player] |= 1 << (progress - self.PATH_LENGTH)
+        self._recompute_token_pos(player, token_index)
 
     def can_move(self, player: int, token_index: int, steps: int) -> bool:
-        token = self.tokens[player][token_index]
-        if token.is_finished(self.path_length, self.goal_length):
-            return False
-        if token.is_home():
+        return self._resolve_move(player, token_index, steps) is not None
+
+    def _resolve_move(
+        self, player: int, token_index: int, steps: int
+    ) -> Optional[Tuple[int, Optional[Tuple[int, int]]]]:
+        """Return ``(new_progress, captured)`` for a legal move, else ``None``.
+
+        ``captured`` is the ``(player, token index)`` of the enemy token the
+        move lands on, if any.
+        """
+
+        progress = self.progress[player][token_index]
+        finish = self._finish_progress
+        if progress == finish:
+            return None
+        if progress == HOME_PROGRESS:
             if steps != 6:
-                return False
-            entry_index = self.START_INDICES[player]
-            occupant = self.token_at_board_index(entry_index)
+                return None
+            occupant = self.board_occupancy.get(self.START_INDICES[player])
             if occupant and occupant[0] == player:
-                return False
-            return True
-        new_progress = token.progress + steps
-        if new_progress > self.path_length + self.goal_length:
-            return False
-        if new_progress < self.path_length:
-            board_index = (self.START_INDICES[player] + new_progress) % self.path_length
-            occupant = self.token_at_board_index(board_index)
+                return None
+            return 0, occupant
+        new_progress = progress + steps
+        if new_progress > finish:
+            return None
+        path_length = self.PATH_LENGTH
+        if new_progress < path_length:
+            occupant = self.board_occupancy.get(self.PLAYER_PATH_INDEX[player][new_progress])
             if occupant and occupant[0] == player:
-                return False
-            return True
+                return None
+            return new_progress, occupant
         # goal path
-        for other in self.tokens[player]:
-            if other is token:
-                continue
-            if other.progress >= self.path_length:
-                if token.progress < self.path_length:
-                    # entering goal, check target only
-                    goal_idx = new_progress - self.path_length
-                    if other.progress == self.path_length + goal_idx:
-                        return False
-                else:
-                    # already in goal: ensure no jump over
-                    for step in range(token.progress + 1, new_progress + 1):
-                        goal_idx = step - self.path_length
-                        if other.progress == self.path_length + goal_idx:
-                            return False
-        return True
+        goal_mask = self._goal_occupancy_mask[player]
+        if progress < path_length:
+            # entering goal, check target only
+            blocked = goal_mask & (1 << (new_progress - path_length))
+        else:
+            # already in goal: ensure no jump over
+            blocked = (goal_mask >> (progress - path_length + 1)) & ((1 << steps) - 1)
+        return None if blocked else (new_progress, None)
+
+    def _compute_movable(self, player: int, steps: int) -> List[int]:
+        """Return the indices of ``player``'s tokens that can move ``steps``."""
+
+        return [token_index for token_index in range(4) if self._resolve_move(player, token_index, steps) is not None]
 
     def move_token(self, player: int, token_index: int):
-        if self.awaiting_roll or self.dice_value is None:
+        steps = self.dice_value
+        if self.awaiting_roll or steps is None:
             return
-        token = self.tokens[player][token_index]
-        if not self.can_move(player, token_index, self.dice_value):
+        resolved = self._resolve_move(player, token_index, steps)
+        if resolved is None:
             return
-        steps = self.dice_value
-        if token.is_home():
-            entry_index = self.START_INDICES[player]
-            occupant = self.token_at_board_index(entry_index)
-            if occupant and occupant[0] != player:
-                captured = self.tokens[occupant[0]][occupant[1]]
-                captured.progress = -1
-                captured.finished_order = None
-                self.message = f"{self.PLAYER_NAMES[player]} schlägt {self.PLAYER_NAMES[occupant[0]]}!"
-            token.progress = 0
+        new_progress, captured = resolved
+        self._hud_dirty = True
+        names = self.PLAYER_NAMES
+        if captured:
+            self.finished_order[captured[0]][captured[1]] = None
+            self._set_progress(captured[0], captured[1], HOME_PROGRESS)
+            self.message = f"{names[player]} schlägt {names[captured[0]]}!"
+        if new_progress == self._finish_progress:
+            finished_count = self.finished_count
+            self.finished_order[player][token_index] = finished_count[player]
+            self._set_progress(player, token_index, new_progress)
+            finished_count[player] += 1
+            if finished_count[player] == 4:
+                self.winner = player
+                self.message = f"{names[player]} gewinnt!"
         else:
-            new_progress = token.progress + steps
-            if new_progress < self.path_length:
-                board_index = (self.START_INDICES[player] + new_progress) % self.path_length
-                occupant = self.token_at_board_index(board_index)
-                if occupant and occupant[0] != player:
-                    captured = self.tokens[occupant[0]][occupant[1]]
-                    captured.progress = -1
-                    captured.finished_order = None
-                    self.message = f"{self.PLAYER_NAMES[player]} schlägt {self.PLAYER_NAMES[occupant[0]]}!"
-                token.progress = new_progress
-            else:
-                if new_progress == self.path_length + self.goal_length:
-                    token.progress = new_progress
-                    token.finished_order = self.finished_count[player]
-                    self.finished_count[player] += 1
-                    if self.finished_count[player] == 4:
-                        self.winner = player
-                        self.message = f"{self.PLAYER_NAMES[player]} gewinnt!"
-                else:
-                    token.progress = new_progress
+            self._set_progress(player, token_index, new_progress)
         if self.winner is None:
             if self.dice_value == 6:
                 self.awaiting_roll = True
@@ -202,6 +225,7 @@ class LudoGame:
         self.dice_value = None if self.awaiting_roll else self.dice_value
 
     def next_player(self):
+        self._hud_dirty = True
         self.current_player = (self.current_player + 1) % 4
         self.awaiting_roll = True
         self.dice_value = None
@@ -209,28 +233,37 @@ class LudoGame:
 
     def handle_events(self, events):
         for event in events:
-            self.back_button.handle_event(event)
-            self.roll_button.handle_event(event)
-            if event.type == pygame.KEYDOWN:
+            event_type = event.type
+            if event_type in self.back_button.accepts:
+                self.back_button.handle_event(event)
+            if event_type in self.roll_button.accepts:
+                self.roll_button.handle_event(event)
+            if event_type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     self.roll_dice()
                 elif event.key == pygame.K_r and self.winner is not None:
                     self.reset()
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if not self.awaiting_roll and self.dice_value is not None and self.movable_tokens and self.winner is None:
-                    mx, my = event.pos
-                    for token_index in self.movable_tokens:
-                        if self.is_token_clicked(self.current_player, token_index, (mx, my)):
-                            self.move_token(self.current_player, token_index)
-                            break
+            elif event_type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                # Only a rolled, undecided turn with movable tokens can take a click.
+                if self.awaiting_roll or self.dice_value is None or not self.movable_tokens or self.winner is not None:
+                    continue
+                for token_index in self.movable_tokens:
+                    if self.is_token_clicked(self.current_player, token_index, event.pos):
+                        self.move_token(self.current_player, token_index)
+                        break
 
     def is_token_clicked(self, player: int, token_index: int, pos: Tuple[int, int]) -> bool:
-        token_pos = self.get_token_screen_position(player, token_index)
-        radius = self.cell_size * 0.4
-        return (token_pos[0] - pos[0]) ** 2 + (token_pos[1] - pos[1]) ** 2 <= radius ** 2
+        token_x, token_y = self._token_screen_pos[player][token_index]
+        dx = token_x - pos[0]
+        dy = token_y - pos[1]
+        return dx * dx + dy * dy <= self._click_radius_sq
 
     def reset(self):
-        self.tokens = [[Token(i) for i in range(4)] for _ in range(4)]
+        self.progress = [[HOME_PROGRESS] * 4 for _ in range(4)]
+        self.finished_order = [[None] * 4 for _ in range(4)]
+        self.board_occupancy = {}
+        self._goal_occupancy_mask = [0, 0, 0, 0]
+        self._recompute_all_token_pos()
         self.finished_count = [0, 0, 0, 0]
         self.current_player = 0
         self.dice_value = None
@@ -238,95 +271,145 @@ class LudoGame:
         self.movable_tokens = []
         self.message = ""
         self.winner = None
+        self._hud_dirty = True
 
     def update(self, delta: float = 0.0):
         pass
 
-    def get_token_screen_position(self, player: int, token_index: int) -> Tuple[float, float]:
-        token = self.tokens[player][token_index]
-        if token.is_home():
-            grid = self.HOME_POSITIONS[player][token.index]
-        elif token.is_finished(self.path_length, self.goal_length):
-            order = token.finished_order or 0
-            order = min(order, len(self.FINISH_POSITIONS[player]) - 1)
-            grid = self.FINISH_POSITIONS[player][order]
-        elif token.progress < self.path_length:
-            board_index = (self.START_INDICES[player] + token.progress) % self.path_length
-            grid = self.PATH[board_index]
+    def get_token_screen_position(self, player: int, token_index: int) -> Tuple[int, int]:
+        return self._token_screen_pos[player][token_index]
+
+    def _recompute_token_pos(self, player: int, token_index: int):
+        progress = self.progress[player][token_index]
+        if progress == HOME_PROGRESS:
+            pos = self._home_pixels[player][token_index]
+        elif progress == self._finish_progress:
+            finish_pixels = self._finish_pixels[player]
+            pos = finish_pixels[min(self.finished_order[player][token_index] or 0, len(finish_pixels) - 1)]
         else:
-            goal_idx = token.progress - self.path_length
-            grid = self.GOAL_PATHS[player][goal_idx]
-        return self.grid_to_pixel(grid)
+            pos = self._progress_pixels[player][progress]
+        self._token_screen_pos[player][token_index] = pos
 
-    def draw_board(self):
-        board_rect = pygame.Rect(self.offset_x, self.offset_y, self.board_size, self.board_size)
-        board_surface = pygame.Surface(board_rect.size, pygame.SRCALPHA)
+    def _recompute_all_token_pos(self):
+        self._token_screen_pos = [[(0, 0)] * 4 for _ in range(4)]
+        for player in range(4):
+            for token_index in range(4):
+                self._recompute_token_pos(player, token_index)
+
+    def _cell_rect(self, coord: Tuple[int, int]) -> pygame.Rect:
+        return pygame.Rect(
+            self.offset_x + coord[0] * self.cell_size,
+            self.offset_y + coord[1] * self.cell_size,
+            self.cell_size,
+            self.cell_size,
+        )
+
+    def _rebuild_geometry(self):
+        self.board_rect = pygame.Rect(self.offset_x, self.offset_y, self.board_size, self.board_size)
+        third = self.board_size / 3
+        self._home_rects = [
+            pygame.Rect(self.offset_x, self.offset_y + self.board_size / 2, third, third),
+            pygame.Rect(self.offset_x, self.offset_y, third, third),
+            pygame.Rect(self.offset_x + self.board_size * 2 / 3, self.offset_y, third, third),
+            pygame.Rect(self.offset_x + self.board_size * 2 / 3, self.offset_y + self.board_size / 2, third, third),
+        ]
+        self._path_rects = [self._cell_rect(coord) for coord in self.PATH]
+        self._goal_rects = [[self._cell_rect(coord) for coord in path] for path in self.GOAL_PATHS]
+        # Pixel centres per player: home spots, every progress step along the
+        # track and goal lane, and the finish slots.
+        self._home_pixels = [[self.grid_to_pixel(grid) for grid in spots] for spots in self.HOME_POSITIONS]
+        self._progress_pixels = [
+            [self.grid_to_pixel(grid) for grid in track + goal]
+            for track, goal in zip(self.PLAYER_PATH_COORDS, self.GOAL_PATHS)
+        ]
+        self._finish_pixels = [[self.grid_to_pixel(grid) for grid in spots] for spots in self.FINISH_POSITIONS]
+        panel_width = min(360, self.screen.get_width() - (self.offset_x + self.board_size + 80))
+        self._hud_rect = pygame.Rect(
+            self.offset_x + self.board_size + 40,
+            self.offset_y,
+            max(280, panel_width),
+            self.board_size,
+        )
+        self._center_rect = pygame.Rect(
+            self.offset_x + 6 * self.cell_size,
+            self.offset_y + 6 * self.cell_size,
+            3 * self.cell_size,
+            3 * self.cell_size,
+        )
+
+    def _render_board_surface(self) -> pygame.Surface:
+        board_surface = pygame.Surface(self.board_rect.size, pygame.SRCALPHA)
         pygame.draw.rect(board_surface, (5, 5, 30, 220), board_surface.get_rect(), border_radius=24)
-        self.screen.blit(board_surface, board_rect.topleft)
+        shift = (-self.board_rect.x, -self.board_rect.y)
         # Home squares
-        home_rects = [
-            pygame.Rect(self.offset_x, self.offset_y + self.board_size / 2, self.board_size / 3, self.board_size / 3),
-            pygame.Rect(self.offset_x, self.offset_y, self.board_size / 3, self.board_size / 3),
-            pygame.Rect(self.offset_x + self.board_size * 2 / 3, self.offset_y, self.board_size / 3, self.board_size / 3),
-            pygame.Rect(self.offset_x + self.board_size * 2 / 3, self.offset_y + self.board_size / 2, self.board_size / 3, self.board_size / 3),
-        ]
-        for idx, rect in enumerate(home_rects):
-            pygame.draw.rect(self.screen, self.COLORS[idx], rect)
-            pygame.draw.rect(self.screen, (255, 255, 255), rect, 3)
+        for idx, rect in enumerate(self._home_rects):
+            rect = rect.move(shift)
+            pygame.draw.rect(board_surface, self.COLORS[idx], rect)
+            pygame.draw.rect(board_surface, (255, 255, 255), rect, 3)
 
         # Draw path squares
-        for coord in self.PATH:
-            rect = pygame.Rect(
-                self.offset_x + coord[0] * self.cell_size,
-                self.offset_y + coord[1] * self.cell_size,
-                self.cell_size,
-                self.cell_size,
-            )
-            pygame.draw.rect(self.screen, (35, 35, 70), rect)
-            pygame.draw.rect(self.screen, (90, 90, 150), rect, 1)
+        for rect in self._path_rects:
+            rect = rect.move(shift)
+            pygame.draw.rect(board_surface, (35, 35, 70), rect)
+            pygame.draw.rect(board_surface, (90, 90, 150), rect, 1)
 
         # Goal paths coloring
-        for player, path in enumerate(self.GOAL_PATHS):
-            for coord in path:
-                rect = pygame.Rect(
-                    self.offset_x + coord[0] * self.cell_size,
-                    self.offset_y + coord[1] * self.cell_size,
-                    self.cell_size,
-                    self.cell_size,
-                )
-                pygame.draw.rect(self.screen, self.COLORS[player], rect)
-                pygame.draw.rect(self.screen, (255, 255, 255), rect, 1)
+        for player, rects in enumerate(self._goal_rects):
+            for rect in rects:
+                rect = rect.move(shift)
+                pygame.draw.rect(board_surface, self.COLORS[player], rect)
+                pygame.draw.rect(board_surface, (255, 255, 255), rect, 1)
 
         # Center goal
-        center_rect = pygame.Rect(
-            self.offset_x + 6 * self.cell_size,
-            self.offset_y + 6 * self.cell_size,
-            3 * self.cell_size,
-            3 * self.cell_size,
-        )
-        pygame.draw.rect(self.screen, (10, 10, 35), center_rect)
-        pygame.draw.rect(self.screen, (255, 255, 255), center_rect, 2)
+        center_rect = self._center_rect.move(shift)
+        pygame.draw.rect(board_surface, (10, 10, 35), center_rect)
+        pygame.draw.rect(board_surface, (255, 255, 255), center_rect, 2)
+        return board_surface.convert_alpha()
+
+    def draw_board(self):
+        self.screen.blit(self._board_surface, self.board_rect.topleft)
+
+    def _render_token_sprites(self):
+        radius = self.cell_size * 0.35
+        # Every sprite shares the same centre so it can be blitted at the
+        # token position minus this offset.
+        self._sprite_offset = int(radius) + 8
+        size = (2 * self._sprite_offset + 1, 2 * self._sprite_offset + 1)
+        center = (self._sprite_offset, self._sprite_offset)
+        self._token_sprites = []
+        for color in self.COLORS:
+            sprites = []
+            for outlined in (False, True):
+                sprite = pygame.Surface(size, pygame.SRCALPHA)
+                pygame.draw.circle(sprite, color, center, radius)
+                if outlined:
+                    pygame.draw.circle(sprite, (0, 0, 0), center, radius, 3)
+                sprites.append(sprite.convert_alpha())
+            self._token_sprites.append(sprites)
+        self._highlight_sprite = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.circle(self._highlight_sprite, NEON_PINK, center, radius + 6, 3)
+        self._highlight_sprite = self._highlight_sprite.convert_alpha()
 
     def draw_tokens(self):
+        blit = self.screen.blit
+        offset = self._sprite_offset
         for player in range(4):
+            sprites = self._token_sprites[player]
+            highlighted = self.movable_tokens if player == self.current_player else ()
             for token_index in range(4):
-                pos = self.get_token_screen_position(player, token_index)
-                radius = self.cell_size * 0.35
-                color = self.COLORS[player]
-                pygame.draw.circle(self.screen, color, pos, radius)
-                if not self.tokens[player][token_index].is_home():
-                    pygame.draw.circle(self.screen, (0, 0, 0), pos, radius, 3)
-                if player == self.current_player and token_index in self.movable_tokens:
-                    pygame.draw.circle(self.screen, NEON_PINK, pos, radius + 6, 3)
+                x, y = self._token_screen_pos[player][token_index]
+                topleft = (x - offset, y - offset)
+                blit(sprites[self.progress[player][token_index] != HOME_PROGRESS], topleft)
+                if token_index in highlighted:
+                    blit(self._highlight_sprite, topleft)
 
     def draw_hud(self):
-        panel_width = min(360, self.screen.get_width() - (self.offset_x + self.board_size + 80))
-        panel_rect = pygame.Rect(
-            self.offset_x + self.board_size + 40,
-            self.offset_y,
-            max(280, panel_width),
-            self.board_size,
-        )
+        if self._hud_dirty:
+            self._hud_text = render_panel_text(self._hud_rect, "Mensch ärgere dich nicht", self._hud_lines())
+            self._hud_dirty = False
+        blit_panel(self.screen, self._hud_rect, self._hud_text)
+
+    def _hud_lines(self) -> List[str]:
         dice_text = str(self.dice_value) if self.dice_value is not None else "-"
         lines = [
             f"Am Zug: {self.PLAYER_NAMES[self.current_player]}",
@@ -338,7 +421,7 @@ class LudoGame:
             lines.append(self.message)
         if self.winner is not None:
             lines.append(f"{self.PLAYER_NAMES[self.winner]} gewinnt! R = Neustart")
-        draw_panel(self.screen, panel_rect, "Mensch ärgere dich nicht", lines)
+        return lines
 
     def draw(self):
         draw_neon_background(self.screen)
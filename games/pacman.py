@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
 from pacman import DIRECTIONS, PacmanLogic
 
-from .theme import draw_neon_background, draw_panel, NEON_PINK
+from .theme import blit_panel, draw_neon_background, render_panel_text, NEON_PINK
 from .ui import BackButton
 
 
 STEP_DURATION = 0.12
+# Upper bound on logic ticks per frame so a long stall cannot trigger a
+# burst of catch-up steps.
+MAX_STEPS_PER_FRAME = 4
 RESPAWN_PAUSE = 1.0
 
 KEY_TO_DIRECTION: Dict[int, Tuple[int, int]] = {
@@ -34,6 +37,11 @@ DIRECTION_ANGLE = {
     DIRECTIONS["UP"]: 270,
 }
 
+DIRECTION_UNIT = {
+    direction: (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for direction, angle in DIRECTION_ANGLE.items()
+}
+
 
 class PacmanGame:
     def __init__(self, screen: pygame.Surface, font: pygame.font.Font, go_back):
@@ -50,6 +58,22 @@ class PacmanGame:
         total_height = self.board_height + self.status_height
         self.offset_x = (self.screen.get_width() - self.board_width) / 2
         self.offset_y = max(60, (self.screen.get_height() - total_height) / 2)
+        self.board_rect = pygame.Rect(self.offset_x, self.offset_y, self.board_width, self.board_height)
+        self._maze_surface = self._render_maze_surface()
+        self._pellet_surface = pygame.Surface(self.board_rect.size, pygame.SRCALPHA).convert_alpha()
+        self._render_pellet_surface()
+
+        self._status_rect = pygame.Rect(
+            self.offset_x,
+            self.offset_y + self.board_height + 24,
+            self.board_width,
+            self.status_height - 24,
+        )
+        self._status_lines: Optional[List[str]] = None
+        self._overlay_surface = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA).convert_alpha()
+        self._overlay_surface.fill((0, 0, 0, 180))
+        self._overlay_subtitle = self.small_font.render("ENTER oder SPACE für Neustart", True, NEON_PINK).convert_alpha()
+        self._overlay_message: Optional[str] = None
 
         self.state = "playing"
         self.game_over_message = ""
@@ -65,6 +89,7 @@ class PacmanGame:
 
     def reset(self) -> None:
         self.logic.reset()
+        self._render_pellet_surface()
         self.state = "playing"
         self.game_over_message = ""
         self.step_accumulator = 0.0
@@ -72,14 +97,17 @@ class PacmanGame:
 
     def handle_events(self, events) -> None:
         for event in events:
-            self.back_button.handle_event(event)
-            if event.type == pygame.KEYDOWN:
+            if event.type in self.back_button.accepts:
+                self.back_button.handle_event(event)
+            elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
                     self.reset()
                 elif self.state == "gameover" and event.key in (pygame.K_RETURN, pygame.K_SPACE):
                     self.reset()
-                elif self.state == "playing" and event.key in KEY_TO_DIRECTION:
-                    self.logic.set_desired_direction(KEY_TO_DIRECTION[event.key])
+                elif self.state == "playing":
+                    direction = KEY_TO_DIRECTION.get(event.key)
+                    if direction is not None:
+                        self.logic.set_desired_direction(direction)
 
     def update(self, delta: float = 0.0) -> None:
         if self.state != "playing":
@@ -90,12 +118,19 @@ class PacmanGame:
             return
 
         self.step_accumulator += delta
-        while self.step_accumulator >= STEP_DURATION:
+        if self.step_accumulator < STEP_DURATION:
+            # Most frames at 60 FPS fall between logic ticks.
+            return
+        for _ in range(MAX_STEPS_PER_FRAME):
+            if self.step_accumulator < STEP_DURATION:
+                break
             self.step_accumulator -= STEP_DURATION
             event = self.logic.tick()
             if event == "life_lost":
                 self.pause_timer = RESPAWN_PAUSE
                 break
+        else:
+            self.step_accumulator %= STEP_DURATION
 
         if not self.logic.is_alive():
             self.state = "gameover"
@@ -124,30 +159,53 @@ class PacmanGame:
             self.tile_size,
         )
 
-    def _draw_maze(self) -> None:
+    def _render_maze_surface(self) -> pygame.Surface:
+        # The maze layout is fixed, so walls and floor outlines are drawn once.
+        maze_surface = pygame.Surface(self.board_rect.size, pygame.SRCALPHA)
+        shift = (-self.board_rect.x, -self.board_rect.y)
         for r in range(self.logic.height):
             for c in range(self.logic.width):
-                rect = self._tile_rect(r, c)
+                rect = self._tile_rect(r, c).move(shift)
                 if (r, c) in self.logic.walls:
-                    pygame.draw.rect(self.screen, (28, 28, 160), rect, border_radius=6)
+                    pygame.draw.rect(maze_surface, (28, 28, 160), rect, border_radius=6)
                 else:
-                    pygame.draw.rect(self.screen, (10, 10, 40), rect, 1)
+                    pygame.draw.rect(maze_surface, (10, 10, 40), rect, 1)
+        return maze_surface.convert_alpha()
+
+    def _draw_maze(self) -> None:
+        self.screen.blit(self._maze_surface, self.board_rect.topleft)
+
+    def _pellet_center(self, row: int, col: int) -> Tuple[int, int]:
+        """Return a pellet's centre relative to the board surface."""
 
-    def _draw_pellets(self) -> None:
         half = self.tile_size // 2
+        return (
+            int(self.offset_x + col * self.tile_size + half) - self.board_rect.x,
+            int(self.offset_y + row * self.tile_size + half) - self.board_rect.y,
+        )
+
+    def _render_pellet_surface(self) -> None:
+        self._pellet_surface.fill((0, 0, 0, 0))
         for row, col in self.logic.pellets:
-            center = (
-                self.offset_x + col * self.tile_size + half,
-                self.offset_y + row * self.tile_size + half,
-            )
-            pygame.draw.circle(self.screen, (255, 191, 0), center, max(2, self.tile_size // 8))
+            pygame.draw.circle(self._pellet_surface, (255, 191, 0), self._pellet_center(row, col), max(2, self.tile_size // 8))
         for row, col in self.logic.power_pellets:
-            center = (
-                self.offset_x + col * self.tile_size + half,
-                self.offset_y + row * self.tile_size + half,
-            )
             radius = max(4, self.tile_size // 4)
-            pygame.draw.circle(self.screen, (255, 255, 255), center, radius)
+            pygame.draw.circle(self._pellet_surface, (255, 255, 255), self._pellet_center(row, col), radius)
+        self._drawn_pellets = self.logic.pellets | self.logic.power_pellets
+
+    def _draw_pellets(self) -> None:
+        # Pellets only disappear during play, so eaten ones are erased from
+        # the cached surface; reset() redraws it when the pellets come back.
+        if self.logic.remaining_pellets() != len(self._drawn_pellets):
+            current = self.logic.pellets | self.logic.power_pellets
+            if current <= self._drawn_pellets:
+                shift = (-self.board_rect.x, -self.board_rect.y)
+                for row, col in self._drawn_pellets - current:
+                    self._pellet_surface.fill((0, 0, 0, 0), self._tile_rect(row, col).move(shift))
+                self._drawn_pellets = current
+            else:
+                self._render_pellet_surface()
+        self.screen.blit(self._pellet_surface, self.board_rect.topleft)
 
     def _draw_characters(self) -> None:
         self._draw_ghosts()
@@ -203,6 +261,9 @@ class PacmanGame:
             )
             pygame.draw.rect(self.screen, color, body_rect)
 
+            unit_x, unit_y = DIRECTION_UNIT.get(ghost.direction, (1.0, 0.0))
+            pupil_dx = unit_x * self.tile_size * 0.05
+            pupil_dy = unit_y * self.tile_size * 0.05
             for i in range(3):
                 eye_center = (
                     head_center[0] - self.tile_size * 0.12 + i * self.tile_size * 0.12,
@@ -212,21 +273,11 @@ class PacmanGame:
                 pygame.draw.circle(
                     self.screen,
                     (20, 20, 60),
-                    (
-                        eye_center[0] + math.cos(math.radians(DIRECTION_ANGLE.get(ghost.direction, 0))) * self.tile_size * 0.05,
-                        eye_center[1] + math.sin(math.radians(DIRECTION_ANGLE.get(ghost.direction, 0))) * self.tile_size * 0.05,
-                    ),
+                    (eye_center[0] + pupil_dx, eye_center[1] + pupil_dy),
                     max(1, self.tile_size // 16),
                 )
 
     def _draw_status_panel(self) -> None:
-        panel_width = self.board_width
-        panel_rect = pygame.Rect(
-            self.offset_x,
-            self.offset_y + self.board_height + 24,
-            panel_width,
-            self.status_height - 24,
-        )
         lines = [
             f"Score: {self.logic.score}",
             f"Level: {self.logic.level}",
@@ -234,15 +285,18 @@ class PacmanGame:
             f"Restliche Punkte: {self.logic.remaining_pellets()}",
             "R = Neustart",
         ]
-        draw_panel(self.screen, panel_rect, "Pac-Man", lines)
+        # Re-render the text only when one of the values shown changed.
+        if lines != self._status_lines:
+            self._status_lines = lines
+            self._status_text = render_panel_text(self._status_rect, "Pac-Man", lines)
+        blit_panel(self.screen, self._status_rect, self._status_text)
 
     def _draw_overlay(self, message: str) -> None:
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
-        title = self.font.render(message, True, (255, 255, 255))
-        subtitle = self.small_font.render("ENTER oder SPACE für Neustart", True, NEON_PINK)
-        title_rect = title.get_rect(center=(self.screen.get_width() / 2, self.screen.get_height() / 2 - 40))
-        sub_rect = subtitle.get_rect(center=(self.screen.get_width() / 2, title_rect.bottom + 40))
-        self.screen.blit(title, title_rect)
-        self.screen.blit(subtitle, sub_rect)
+        if message != self._overlay_message:
+            self._overlay_message = message
+            self._overlay_title = self.font.render(message, True, (255, 255, 255)).convert_alpha()
+        self.screen.blit(self._overlay_surface, (0, 0))
+        title_rect = self._overlay_title.get_rect(center=(self.screen.get_width() / 2, self.screen.get_height() / 2 - 40))
+        sub_rect = self._overlay_subtitle.get_rect(center=(self.screen.get_width() / 2, title_rect.bottom + 40))
+        self.screen.blit(self._overlay_title, title_rect)
+        self.screen.blit(self._overlay_subtitle, sub_rect)
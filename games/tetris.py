@@ -1,23 +1,49 @@
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import pygame
 
-from .theme import NEON_PINK, draw_neon_background, draw_panel
+from .theme import NEON_PINK, blit_panel, draw_neon_background, render_panel_text
 from .ui import BackButton
 
 
+def _rotations(layout):
+    """Return the four rotation states of a shape, each turned by (x, y) -> (y, -x)."""
+
+    shapes = [tuple(layout)]
+    for _ in range(3):
+        shapes.append(tuple((y, -x) for x, y in shapes[-1]))
+    return tuple(shapes)
+
+
+def _row_masks(shape):
+    """Return (min_x, max_x, ((dy, bits), ...)) with bits relative to min_x."""
+
+    min_x = min(x for x, _ in shape)
+    max_x = max(x for x, _ in shape)
+    rows = {}
+    for x, y in shape:
+        rows[y] = rows.get(y, 0) | 1 << (x - min_x)
+    return min_x, max_x, tuple(sorted(rows.items()))
+
+
 class TetrisGame:
     COLS = 10
     ROWS = 20
+    FULL_ROW = (1 << COLS) - 1
     SHAPES = {
-        "I": [[(0, 1), (1, 1), (2, 1), (3, 1)]],
-        "J": [[(0, 0), (0, 1), (1, 1), (2, 1)]],
-        "L": [[(0, 1), (1, 1), (2, 1), (2, 0)]],
-        "O": [[(0, 0), (1, 0), (0, 1), (1, 1)]],
-        "S": [[(0, 1), (1, 1), (1, 0), (2, 0)]],
-        "T": [[(0, 1), (1, 1), (2, 1), (1, 0)]],
-        "Z": [[(0, 0), (1, 0), (1, 1), (2, 1)]],
+        "I": (((0, 1), (1, 1), (2, 1), (3, 1)),),
+        "J": (((0, 0), (0, 1), (1, 1), (2, 1)),),
+        "L": (((0, 1), (1, 1), (2, 1), (2, 0)),),
+        "O": (((0, 0), (1, 0), (0, 1), (1, 1)),),
+        "S": (((0, 1), (1, 1), (1, 0), (2, 0)),),
+        "T": (((0, 1), (1, 1), (2, 1), (1, 0)),),
+        "Z": (((0, 0), (1, 0), (1, 1), (2, 1)),),
+    }
+    SHAPE_TYPES = tuple(SHAPES)
+    ROTATIONS = {shape_type: _rotations(layouts[0]) for shape_type, layouts in SHAPES.items()}
+    ROW_MASKS = {
+        shape_type: tuple(_row_masks(shape) for shape in shapes) for shape_type, shapes in ROTATIONS.items()
     }
     COLORS = {
         "I": (0, 255, 255),
@@ -37,11 +63,47 @@ class TetrisGame:
         self.play_height = self.block_size * self.ROWS
         self.offset_x = (screen.get_width() - self.play_width) // 2
         self.offset_y = (screen.get_height() - self.play_height) // 2
+        self._cell_rects = [
+            [
+                pygame.Rect(
+                    self.offset_x + x * self.block_size,
+                    self.offset_y + y * self.block_size,
+                    self.block_size,
+                    self.block_size,
+                )
+                for x in range(self.COLS)
+            ]
+            for y in range(self.ROWS)
+        ]
+        self._board_bg_surface = pygame.Surface((self.play_width, self.play_height), pygame.SRCALPHA)
+        pygame.draw.rect(self._board_bg_surface, (0, 0, 0, 120), self._board_bg_surface.get_rect(), border_radius=16)
+        self._board_bg_surface = self._board_bg_surface.convert_alpha()
+        self._grid_surface = self._render_grid_surface()
+        self._block_surfaces = {color: self._render_block(color) for color in self.COLORS.values()}
+        self._sidebar_rect = pygame.Rect(
+            self.offset_x + self.play_width + 40,
+            self.offset_y,
+            self.block_size * 6,
+            self.play_height,
+        )
+        self._sidebar_lines: Optional[List[str]] = None
+        self._game_over_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA).convert_alpha()
+        self._game_over_surface.fill((0, 0, 0, 180))
+        self._game_over_title = self.font.render("Game Over - Enter für Neustart", True, (255, 255, 255)).convert_alpha()
+        self._game_over_title_rect = self._game_over_title.get_rect(
+            center=(screen.get_width() // 2, screen.get_height() // 2)
+        )
 
         self.board: List[List[Tuple[int, int, int] | None]] = [
             [None for _ in range(self.COLS)] for _ in range(self.ROWS)
         ]
+        # Occupied cells per row as a bitmask (bit x = column x); board keeps
+        # the colours for drawing.
+        self.rows: List[int] = [0] * self.ROWS
+        # Topmost occupied row per column (ROWS when the column is empty).
+        self.column_top: List[int] = [self.ROWS] * self.COLS
         self.current_piece = None
+        self._bag: List[str] = []
         self.next_piece = self._get_new_piece()
         self.drop_timer = 0.0
         self.fall_interval = 0.5
@@ -54,11 +116,15 @@ class TetrisGame:
         self.spawn_piece()
 
     def _get_new_piece(self):
-        shape_type = random.choice(list(self.SHAPES.keys()))
-        layout = self.SHAPES[shape_type][0]
+        # 7-bag: every shape comes up once, in random order, before any repeats.
+        if not self._bag:
+            self._bag = list(self.SHAPE_TYPES)
+            random.shuffle(self._bag)
+        shape_type = self._bag.pop()
         return {
-            "shape": [(x, y) for x, y in layout],
+            "shape": self.ROTATIONS[shape_type][0],
             "type": shape_type,
+            "color": self.COLORS[shape_type],
             "rotation": 0,
             "x": self.COLS // 2 - 2,
             "y": 0,
@@ -71,20 +137,26 @@ class TetrisGame:
             self.game_over = True
 
     def rotate(self):
-        if self.current_piece["type"] == "O":
+        piece = self.current_piece
+        if piece["type"] == "O":
             return
-        rotated = [(y, -x) for x, y in self.current_piece["shape"]]
-        original_shape = self.current_piece["shape"]
-        self.current_piece["shape"] = rotated
-        if not self.valid_space(self.current_piece):
-            self.current_piece["shape"] = original_shape
+        original_rotation = piece["rotation"]
+        piece["rotation"] = (original_rotation + 1) & 3
+        if self.valid_space(piece):
+            piece["shape"] = self.ROTATIONS[piece["type"]][piece["rotation"]]
+        else:
+            piece["rotation"] = original_rotation
 
     def valid_space(self, piece):
-        formatted = self.convert_shape_format(piece)
-        for x, y in formatted:
-            if x < 0 or x >= self.COLS or y >= self.ROWS:
+        min_x, max_x, row_masks = self.ROW_MASKS[piece["type"]][piece["rotation"]]
+        left = piece["x"] + min_x
+        if left < 0 or piece["x"] + max_x >= self.COLS:
+            return False
+        for dy, bits in row_masks:
+            y = piece["y"] + dy
+            if y >= self.ROWS:
                 return False
-            if y >= 0 and self.board[y][x]:
+            if y >= 0 and self.rows[y] & bits << left:
                 return False
         return True
 
@@ -95,19 +167,25 @@ class TetrisGame:
         return positions
 
     def lock_piece(self):
+        color = self.current_piece["color"]
         for x, y in self.convert_shape_format(self.current_piece):
             if 0 <= y < self.ROWS:
-                self.board[y][x] = self.COLORS[self.current_piece["type"]]
+                self.board[y][x] = color
+                self.rows[y] |= 1 << x
+                if y < self.column_top[x]:
+                    self.column_top[x] = y
         self.clear_rows()
         self.spawn_piece()
 
     def clear_rows(self):
-        rows_to_clear = [i for i in range(self.ROWS) if all(self.board[i])]
-        for i in rows_to_clear:
-            del self.board[i]
-            self.board.insert(0, [None for _ in range(self.COLS)])
-        if rows_to_clear:
-            lines = len(rows_to_clear)
+        kept = [i for i in range(self.ROWS) if self.rows[i] != self.FULL_ROW]
+        lines = self.ROWS - len(kept)
+        if lines:
+            self.board = [[None for _ in range(self.COLS)] for _ in range(lines)] + [self.board[i] for i in kept]
+            self.rows = [0] * lines + [self.rows[i] for i in kept]
+            self.column_top = [
+                next((y for y in range(self.ROWS) if self.rows[y] >> x & 1), self.ROWS) for x in range(self.COLS)
+            ]
             self.lines_cleared += lines
             self.score += (100 * lines) * self.level
             if self.lines_cleared // 10 >= self.level:
@@ -115,6 +193,14 @@ class TetrisGame:
                 self.fall_interval = max(0.1, self.fall_interval * 0.85)
 
     def hard_drop(self):
+        piece = self.current_piece
+        cells = self.convert_shape_format(piece)
+        # With nothing between the piece and the column tops, the landing row
+        # follows directly; pieces tucked under an overhang step down instead.
+        if all(y < self.column_top[x] for x, y in cells):
+            piece["y"] += min(self.column_top[x] - y for x, y in cells) - 1
+            self.lock_piece()
+            return
         while True:
             self.current_piece["y"] += 1
             if not self.valid_space(self.current_piece):
@@ -149,7 +235,10 @@ class TetrisGame:
 
     def reset(self):
         self.board = [[None for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        self.rows = [0] * self.ROWS
+        self.column_top = [self.ROWS] * self.COLS
         self.current_piece = None
+        self._bag = []
         self.next_piece = self._get_new_piece()
         self.drop_timer = 0.0
         self.fall_interval = 0.5
@@ -170,43 +259,38 @@ class TetrisGame:
                 self.lock_piece()
             self.drop_timer = 0.0
 
-    def draw_grid(self):
+    def _render_grid_surface(self) -> pygame.Surface:
+        grid_surface = pygame.Surface((self.play_width, self.play_height), pygame.SRCALPHA)
         for y in range(self.ROWS):
             for x in range(self.COLS):
-                rect = pygame.Rect(
-                    self.offset_x + x * self.block_size,
-                    self.offset_y + y * self.block_size,
-                    self.block_size,
-                    self.block_size,
-                )
-                pygame.draw.rect(self.screen, (40, 40, 40), rect, 1)
+                rect = self._cell_rects[y][x].move(-self.offset_x, -self.offset_y)
+                pygame.draw.rect(grid_surface, (40, 40, 40), rect, 1)
+        return grid_surface.convert_alpha()
+
+    def _render_block(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        block = pygame.Surface((self.block_size, self.block_size))
+        block.fill(color)
+        pygame.draw.rect(block, (0, 0, 0), block.get_rect(), 1)
+        return block.convert()
+
+    def draw_grid(self):
+        self.screen.blit(self._grid_surface, (self.offset_x, self.offset_y))
 
     def draw_board(self):
-        for y in range(self.ROWS):
-            for x in range(self.COLS):
-                color = self.board[y][x]
+        blit = self.screen.blit
+        blocks = self._block_surfaces
+        for mask, colors, rects in zip(self.rows, self.board, self._cell_rects):
+            if not mask:
+                continue
+            for color, rect in zip(colors, rects):
                 if color:
-                    rect = pygame.Rect(
-                        self.offset_x + x * self.block_size,
-                        self.offset_y + y * self.block_size,
-                        self.block_size,
-                        self.block_size,
-                    )
-                    pygame.draw.rect(self.screen, color, rect)
-                    pygame.draw.rect(self.screen, (0, 0, 0), rect, 1)
+                    blit(blocks[color], rect)
 
     def draw_piece(self, piece):
-        color = self.COLORS[piece["type"]]
+        block = self._block_surfaces[piece["color"]]
         for x, y in self.convert_shape_format(piece):
             if y >= 0:
-                rect = pygame.Rect(
-                    self.offset_x + x * self.block_size,
-                    self.offset_y + y * self.block_size,
-                    self.block_size,
-                    self.block_size,
-                )
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, (0, 0, 0), rect, 1)
+                self.screen.blit(block, self._cell_rects[y][x])
 
     def draw_next_piece(self, panel_rect: pygame.Rect):
         preview_size = self.block_size * 4
@@ -218,25 +302,15 @@ class TetrisGame:
         )
         pygame.draw.rect(self.screen, (0, 0, 0, 140), preview_rect, border_radius=12)
         piece = self.next_piece
-        color = self.COLORS[piece["type"]]
+        block = self._block_surfaces[piece["color"]]
+        block_size = self.block_size
         for x, y in piece["shape"]:
-            rect = pygame.Rect(
-                preview_rect.x + (x + 1) * self.block_size,
-                preview_rect.y + (y + 1) * self.block_size,
-                self.block_size,
-                self.block_size,
+            self.screen.blit(
+                block,
+                (preview_rect.x + (x + 1) * block_size, preview_rect.y + (y + 1) * block_size),
             )
-            pygame.draw.rect(self.screen, color, rect)
-            pygame.draw.rect(self.screen, (0, 0, 0), rect, 1)
 
     def draw_sidebar(self):
-        panel_width = self.block_size * 6
-        panel_rect = pygame.Rect(
-            self.offset_x + self.play_width + 40,
-            self.offset_y,
-            panel_width,
-            self.play_height,
-        )
         lines = [
             f"Level: {self.level}",
             f"Linien: {self.lines_cleared}",
@@ -244,22 +318,19 @@ class TetrisGame:
             "Leertaste = Hard Drop",
             "R = Neustart",
         ]
-        draw_panel(self.screen, panel_rect, "Tetris", lines)
-        self.draw_next_piece(panel_rect)
+        if lines != self._sidebar_lines:
+            self._sidebar_lines = lines
+            self._sidebar_text = render_panel_text(self._sidebar_rect, "Tetris", lines)
+        blit_panel(self.screen, self._sidebar_rect, self._sidebar_text)
+        self.draw_next_piece(self._sidebar_rect)
 
     def draw_game_over(self):
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
-        title = self.font.render("Game Over - Enter für Neustart", True, (255, 255, 255))
-        rect = title.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
-        self.screen.blit(title, rect)
+        self.screen.blit(self._game_over_surface, (0, 0))
+        self.screen.blit(self._game_over_title, self._game_over_title_rect)
 
     def draw(self):
         draw_neon_background(self.screen)
-        board_bg = pygame.Surface((self.play_width, self.play_height), pygame.SRCALPHA)
-        pygame.draw.rect(board_bg, (0, 0, 0, 120), board_bg.get_rect(), border_radius=16)
-        self.screen.blit(board_bg, (self.offset_x, self.offset_y))
+        self.screen.blit(self._board_bg_surface, (self.offset_x, self.offset_y))
         self.draw_board()
         self.draw_piece(self.current_piece)
         self.draw_grid()
@@ -5,7 +5,7 @@ from __future__ import annotations
 import math
 import random
 from functools import lru_cache
-from typing import Iterable, Tuple
+from typing import Iterable, List, Tuple
 
 import pygame
 
@@ -25,8 +25,9 @@ def _lerp(a: float, b: float, t: float) -> float:
 
 @lru_cache(maxsize=4)
 def _gradient_surface(size: Tuple[int, int]) -> pygame.Surface:
-    width, height = size
-    surface = pygame.Surface(size)
+    # The gradient is vertical only: colour one pixel column and stretch it.
+    height = size[1]
+    column = pygame.Surface((1, height))
     for y in range(height):
         t = y / max(height - 1, 1)
         color = (
@@ -34,8 +35,8 @@ def _gradient_surface(size: Tuple[int, int]) -> pygame.Surface:
             int(_lerp(DEEP_SPACE[1], NEON_PURPLE[1], t)),
             int(_lerp(DEEP_SPACE[2], NEON_PURPLE[2], t)),
         )
-        pygame.draw.line(surface, color, (0, y), (width, y))
-    return surface
+        column.set_at((0, y), color)
+    return pygame.transform.scale(column, size).convert()
 
 
 _STARFIELD_CACHE: dict[Tuple[int, int], Iterable[Tuple[float, float, float]]] = {}
@@ -55,6 +56,33 @@ def _get_starfield(size: Tuple[int, int]) -> Iterable[Tuple[float, float, float]
     return _STARFIELD_CACHE[size]
 
 
+@lru_cache(maxsize=4)
+def _star_placements(size: Tuple[int, int]) -> Tuple[Tuple[Tuple[int, int], int, float], ...]:
+    """Per star: sprite top-left, radius in pixels and pulse phase."""
+
+    placements = []
+    for sx, sy, radius in _get_starfield(size):
+        x = int(sx * size[0])
+        y = int(sy * size[1])
+        star_radius = max(1, int(radius * 2))
+        placements.append(((x - star_radius, y - star_radius), star_radius, sx * 10))
+    return tuple(placements)
+
+
+@lru_cache(maxsize=512)
+def _star_sprite(radius: int, brightness: int) -> pygame.Surface:
+    sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (brightness, brightness, 255, 180), (radius, radius), radius)
+    return sprite.convert_alpha()
+
+
+@lru_cache(maxsize=8)
+def _layer_surface(size: Tuple[int, int], layer: str) -> pygame.Surface:
+    """Scratch SRCALPHA surface reused every frame for an animated layer."""
+
+    return pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+
+
 def draw_neon_background(surface: pygame.Surface) -> None:
     """Draw a stylised neon gradient with starfield and scrolling grid."""
 
@@ -63,73 +91,127 @@ def draw_neon_background(surface: pygame.Surface) -> None:
 
     time_seconds = pygame.time.get_ticks() / 1000.0
 
-    star_surface = pygame.Surface(size, pygame.SRCALPHA)
-    for sx, sy, radius in _get_starfield(size):
-        x = int(sx * size[0])
-        y = int(sy * size[1])
-        pulse = 0.5 + 0.5 * math.sin(time_seconds * 2.5 + sx * 10)
-        brightness = int(_lerp(120, 255, pulse))
-        pygame.draw.circle(
-            star_surface,
-            (brightness, brightness, 255, 180),
-            (x, y),
-            max(1, int(radius * 2)),
-        )
-    surface.blit(star_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+    # Stars are added straight onto the frame from small cached sprites
+    # instead of a full-window layer; the brightness pulse picks the sprite.
+    blit = surface.blit
+    pulse_time = time_seconds * 2.5
+    for topleft, star_radius, phase in _star_placements(size):
+        pulse = 0.5 + 0.5 * math.sin(pulse_time + phase)
+        brightness = int(120 + 135 * pulse)  # _lerp(120, 255, pulse), inlined
+        blit(_star_sprite(star_radius, brightness), topleft, special_flags=pygame.BLEND_ADD)
 
     draw_neon_grid(surface)
     draw_scanlines(surface)
 
 
+def _grid_top(height: int) -> int:
+    # Grid lines start at 30% of the height; keep a couple of rows above for
+    # the 2px line width.
+    return max(0, int(height * 0.3) - 2)
+
+
+@lru_cache(maxsize=4)
+def _grid_tile(size: Tuple[int, int], spacing: int) -> pygame.Surface:
+    """Vertical grid lines at scroll offset 0, shifted right by ``spacing``.
+
+    The line left of the window is not baked in; see :func:`draw_neon_grid`.
+    """
+
+    width, height = size
+    top = _grid_top(height)
+    tile = pygame.Surface((width + 2 * spacing, height - top), pygame.SRCALPHA)
+    for x in range(spacing, width + 2 * spacing, spacing):
+        pygame.draw.line(tile, (*NEON_BLUE, 70), (x, height * 0.3 - top), (x, height - top), 2)
+    return tile.convert_alpha()
+
+
 def draw_neon_grid(surface: pygame.Surface, spacing: int = 120) -> None:
     width, height = surface.get_size()
-    grid_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    top = _grid_top(height)
+    grid_surface = _layer_surface((width, height - top), "grid")
+    grid_surface.fill((0, 0, 0, 0))
     offset = (pygame.time.get_ticks() / 20) % spacing
 
-    for x in range(-spacing, width + spacing, spacing):
-        pygame.draw.line(
-            grid_surface,
-            (*NEON_BLUE, 70),
-            (x + offset, height * 0.3),
-            (x + offset, height),
-            2,
-        )
+    # Copy the scrolled vertical lines in (adding onto a cleared layer is a
+    # plain copy), then draw the horizontal lines over them.
+    grid_surface.blit(
+        _grid_tile((width, height), spacing),
+        (int(offset) - spacing, 0),
+        special_flags=pygame.BLEND_RGBA_ADD,
+    )
+    if offset - spacing > -1:
+        # pygame truncates toward zero, so once it is less than a pixel off
+        # the left edge that line lands on column 0.
+        x = offset - spacing
+        pygame.draw.line(grid_surface, (*NEON_BLUE, 70), (x, height * 0.3 - top), (x, height - top), 2)
 
     for i in range(10):
-        y = height * 0.3 + i * spacing * 0.18
-        pygame.draw.line(
-            grid_surface,
-            (*NEON_PINK, max(20, 120 - i * 10)),
-            (0, y + offset * 0.1),
-            (width, y + offset * 0.1),
-            2,
-        )
+        y = height * 0.3 + i * spacing * 0.18 + offset * 0.1 - top
+        pygame.draw.line(grid_surface, (*NEON_PINK, max(20, 120 - i * 10)), (0, y), (width, y), 2)
 
-    surface.blit(grid_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+    surface.blit(grid_surface, (0, top), special_flags=pygame.BLEND_ADD)
 
 
-def draw_scanlines(surface: pygame.Surface) -> None:
-    width, height = surface.get_size()
-    scan_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+@lru_cache(maxsize=4)
+def _scanline_surface(size: Tuple[int, int]) -> pygame.Surface:
+    # Like the gradient, the stripes only vary by row: fill one column and stretch it.
+    height = size[1]
+    column = pygame.Surface((1, height), pygame.SRCALPHA)
     for y in range(0, height, 4):
         alpha = 35 if (y // 4) % 2 == 0 else 15
-        pygame.draw.line(scan_surface, (0, 0, 0, alpha), (0, y), (width, y))
-    surface.blit(scan_surface, (0, 0))
+        column.set_at((0, y), (0, 0, 0, alpha))
+    return pygame.transform.scale(column, size).convert_alpha()
 
 
-def draw_panel(surface: pygame.Surface, rect: pygame.Rect, title: str, lines: Iterable[str]) -> None:
-    panel_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+def draw_scanlines(surface: pygame.Surface) -> None:
+    surface.blit(_scanline_surface(surface.get_size()), (0, 0))
+
+
+PanelText = List[Tuple[pygame.Surface, Tuple[int, int]]]
+
+
+@lru_cache(maxsize=16)
+def _panel_background(size: Tuple[int, int]) -> pygame.Surface:
+    panel_surface = pygame.Surface(size, pygame.SRCALPHA)
     pygame.draw.rect(panel_surface, (*NEON_BLUE, 120), panel_surface.get_rect(), border_radius=16)
     pygame.draw.rect(panel_surface, NEON_PINK, panel_surface.get_rect(), width=3, border_radius=16)
-    surface.blit(panel_surface, rect.topleft)
+    return panel_surface.convert_alpha()
 
-    font = pygame.font.SysFont("arial", max(18, int(rect.height * 0.12)), bold=True)
-    title_surface = font.render(title, True, (255, 255, 255))
-    surface.blit(title_surface, (rect.x + 20, rect.y + 16))
 
-    body_font = pygame.font.SysFont("arial", max(16, int(rect.height * 0.1)))
-    offset_y = rect.y + 20 + title_surface.get_height()
+@lru_cache(maxsize=32)
+def _get_font(size: int, bold: bool = False) -> pygame.font.Font:
+    return pygame.font.SysFont("arial", size, bold=bold)
+
+
+@lru_cache(maxsize=16)
+def _panel_title(title: str, size: int) -> pygame.Surface:
+    return _get_font(size, True).render(title, True, (255, 255, 255)).convert_alpha()
+
+
+def render_panel_text(rect: pygame.Rect, title: str, lines: Iterable[str]) -> PanelText:
+    """Render a panel's title and lines, positioned relative to ``rect``.
+
+    The result can be kept and passed to :func:`blit_panel` every frame so
+    text only has to be re-rendered when it changes.
+    """
+
+    title_surface = _panel_title(title, max(18, int(rect.height * 0.12)))
+    text = [(title_surface, (20, 16))]
+
+    body_font = _get_font(max(16, int(rect.height * 0.1)))
+    offset_y = 20 + title_surface.get_height()
     for line in lines:
-        text_surface = body_font.render(line, True, (230, 240, 255))
-        surface.blit(text_surface, (rect.x + 20, offset_y))
+        text_surface = body_font.render(line, True, (230, 240, 255)).convert_alpha()
+        text.append((text_surface, (20, offset_y)))
         offset_y += text_surface.get_height() + 6
+    return text
+
+
+def blit_panel(surface: pygame.Surface, rect: pygame.Rect, text: PanelText) -> None:
+    surface.blit(_panel_background(rect.size), rect.topleft)
+    for text_surface, (dx, dy) in text:
+        surface.blit(text_surface, (rect.x + dx, rect.y + dy))
+
+
+def draw_panel(surface: pygame.Surface, rect: pygame.Rect, title: str, lines: Iterable[str]) -> None:
+    blit_panel(surface, rect, render_panel_text(rect, title, lines))
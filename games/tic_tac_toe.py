@@ -1,14 +1,26 @@
 import pygame
 
-from .theme import NEON_PINK, draw_neon_background, draw_panel
+from .theme import NEON_PINK, blit_panel, draw_neon_background, render_panel_text
 from .ui import BackButton
 
+# Cell (row, col) is bit row * 3 + col of a player's mask.
+FULL_BOARD = 0b111111111
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100,  # diagonals
+)
+# Board cells hold an index into PLAYERS: 0 when empty, else the mark.
+PLAYERS = (None, "X", "O")
+MARKS = {"X": 1, "O": 2}
+
 
 class TicTacToeGame:
     def __init__(self, screen: pygame.Surface, font: pygame.font.Font, go_back):
         self.screen = screen
         self.font = font
-        self.board = [[None for _ in range(3)] for _ in range(3)]
+        self.board = bytearray(9)
+        self.player_bits = {"X": 0, "O": 0}
         self.current_player = "X"
         self.winner = None
         self.back_button = BackButton(font, go_back)
@@ -16,6 +28,47 @@ class TicTacToeGame:
         self.cell_size = self.grid_size / 3
         self.offset_x = (screen.get_width() - self.grid_size) / 2
         self.offset_y = (screen.get_height() - self.grid_size) / 2
+        self._status_rect = pygame.Rect(
+            self.offset_x,
+            self.offset_y + self.grid_size + 30,
+            self.grid_size,
+            140,
+        )
+        # Status text only depends on whose turn it is.
+        self._status_text = {
+            player: render_panel_text(
+                self._status_rect,
+                "Tic Tac Toe",
+                [f"Am Zug: {player}", "R = Neustart", "Drei in einer Reihe zum Sieg!"],
+            )
+            for player in ("X", "O")
+        }
+        self._win_message = None
+        # Board chrome and marks are drawn into one surface, redrawn only when
+        # a mark is placed. The margin leaves room for the outer grid lines.
+        margin = 8
+        self._board_origin = (int(self.offset_x) - margin, int(self.offset_y) - margin)
+        self._board_surface_size = (int(self.grid_size) + 2 * margin + 1, int(self.grid_size) + 2 * margin + 1)
+        self._board_dirty = True
+        # Grid and mark geometry only depends on the layout, so it is computed
+        # once. Positions are worked out in screen space and shifted by the
+        # integer origin, so they truncate to the same pixels as on screen.
+        origin_x, origin_y = self._board_origin
+        offset_x = self.offset_x - origin_x
+        offset_y = self.offset_y - origin_y
+        self._grid_lines = []
+        for i in range(4):
+            self._grid_lines.append(((offset_x + i * self.cell_size, offset_y), (offset_x + i * self.cell_size, offset_y + self.grid_size)))
+            self._grid_lines.append(((offset_x, offset_y + i * self.cell_size), (offset_x + self.grid_size, offset_y + i * self.cell_size)))
+        self._cell_centers = [
+            (
+                self.offset_x + col * self.cell_size + self.cell_size / 2 - origin_x,
+                self.offset_y + row * self.cell_size + self.cell_size / 2 - origin_y,
+            )
+            for row in range(3)
+            for col in range(3)
+        ]
+        self._x_half = self.cell_size / 2.5
 
     def handle_events(self, events):
         for event in events:
@@ -23,13 +76,18 @@ class TicTacToeGame:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and not self.winner:
                 mx, my = event.pos
                 if self.offset_x <= mx <= self.offset_x + self.grid_size and self.offset_y <= my <= self.offset_y + self.grid_size:
-                    col = int((mx - self.offset_x) // self.cell_size)
-                    row = int((my - self.offset_y) // self.cell_size)
-                    if self.board[row][col] is None:
-                        self.board[row][col] = self.current_player
+                    # Clicks on the far edge land in the last row/column
+                    # rather than past the end of the flat board.
+                    col = min(2, int((mx - self.offset_x) // self.cell_size))
+                    row = min(2, int((my - self.offset_y) // self.cell_size))
+                    index = row * 3 + col
+                    if not self.board[index]:
+                        self.board[index] = MARKS[self.current_player]
+                        self._board_dirty = True
+                        self.player_bits[self.current_player] |= 1 << index
                         if self.check_winner(row, col):
                             self.winner = self.current_player
-                        elif all(all(cell is not None for cell in row_data) for row_data in self.board):
+                        elif self.player_bits["X"] | self.player_bits["O"] == FULL_BOARD:
                             self.winner = "Unentschieden"
                         else:
                             self.current_player = "O" if self.current_player == "X" else "X"
@@ -37,66 +95,54 @@ class TicTacToeGame:
                 self.reset()
 
     def reset(self):
-        self.board = [[None for _ in range(3)] for _ in range(3)]
+        self.board = bytearray(9)
+        self._board_dirty = True
+        self.player_bits = {"X": 0, "O": 0}
         self.current_player = "X"
         self.winner = None
 
     def check_winner(self, row, col):
-        player = self.board[row][col]
-        win_row = all(self.board[row][c] == player for c in range(3))
-        win_col = all(self.board[r][col] == player for r in range(3))
-        diag1 = row == col and all(self.board[i][i] == player for i in range(3))
-        diag2 = row + col == 2 and all(self.board[i][2 - i] == player for i in range(3))
-        return win_row or win_col or diag1 or diag2
+        bits = self.player_bits[PLAYERS[self.board[row * 3 + col]]]
+        return any(bits & mask == mask for mask in WIN_MASKS)
 
     def update(self, delta: float = 0.0):
         pass
 
-    def draw(self):
-        draw_neon_background(self.screen)
+    def _render_board_surface(self) -> pygame.Surface:
+        board_surface = pygame.Surface(self._board_surface_size, pygame.SRCALPHA)
+        origin_x, origin_y = self._board_origin
         board_rect = pygame.Rect(self.offset_x, self.offset_y, self.grid_size, self.grid_size)
-        board_surface = pygame.Surface(board_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(board_surface, (5, 5, 30, 200), board_surface.get_rect(), border_radius=24)
-        self.screen.blit(board_surface, board_rect.topleft)
-        for i in range(4):
-            start_pos = (self.offset_x + i * self.cell_size, self.offset_y)
-            end_pos = (self.offset_x + i * self.cell_size, self.offset_y + self.grid_size)
-            pygame.draw.line(self.screen, (120, 210, 255), start_pos, end_pos, 6)
-            start_pos = (self.offset_x, self.offset_y + i * self.cell_size)
-            end_pos = (self.offset_x + self.grid_size, self.offset_y + i * self.cell_size)
-            pygame.draw.line(self.screen, (120, 210, 255), start_pos, end_pos, 6)
+        pygame.draw.rect(board_surface, (5, 5, 30, 200), board_rect.move(-origin_x, -origin_y), border_radius=24)
+        for start_pos, end_pos in self._grid_lines:
+            pygame.draw.line(board_surface, (120, 210, 255), start_pos, end_pos, 6)
 
-        for row in range(3):
-            for col in range(3):
-                center = (
-                    self.offset_x + col * self.cell_size + self.cell_size / 2,
-                    self.offset_y + row * self.cell_size + self.cell_size / 2,
-                )
-                if self.board[row][col] == "X":
-                    size = self.cell_size / 2.5
-                    pygame.draw.line(self.screen, NEON_PINK, (center[0] - size, center[1] - size), (center[0] + size, center[1] + size), 10)
-                    pygame.draw.line(self.screen, NEON_PINK, (center[0] + size, center[1] - size), (center[0] - size, center[1] + size), 10)
-                elif self.board[row][col] == "O":
-                    pygame.draw.circle(self.screen, (64, 255, 215), center, self.cell_size / 2.5, 10)
+        size = self._x_half
+        for index, mark in enumerate(self.board):
+            if not mark:
+                continue
+            center = self._cell_centers[index]
+            if mark == MARKS["X"]:
+                pygame.draw.line(board_surface, NEON_PINK, (center[0] - size, center[1] - size), (center[0] + size, center[1] + size), 10)
+                pygame.draw.line(board_surface, NEON_PINK, (center[0] + size, center[1] - size), (center[0] - size, center[1] + size), 10)
+            else:
+                pygame.draw.circle(board_surface, (64, 255, 215), center, size, 10)
+        return board_surface.convert_alpha()
 
-        panel_width = self.grid_size
-        panel_rect = pygame.Rect(
-            self.offset_x,
-            self.offset_y + self.grid_size + 30,
-            panel_width,
-            140,
-        )
-        status_lines = [
-            f"Am Zug: {self.current_player}",
-            "R = Neustart",
-            "Drei in einer Reihe zum Sieg!",
-        ]
-        draw_panel(self.screen, panel_rect, "Tic Tac Toe", status_lines)
+    def draw(self):
+        draw_neon_background(self.screen)
+        if self._board_dirty:
+            self._board_surface = self._render_board_surface()
+            self._board_dirty = False
+        self.screen.blit(self._board_surface, self._board_origin)
+
+        blit_panel(self.screen, self._status_rect, self._status_text[self.current_player])
 
         if self.winner:
             message = "Unentschieden" if self.winner == "Unentschieden" else f"Gewinner: {self.winner}"
-            win_text = self.font.render(message, True, (255, 215, 0))
-            rect = win_text.get_rect(center=(self.screen.get_width() / 2, self.offset_y - 120))
-            self.screen.blit(win_text, rect)
+            if message != self._win_message:
+                self._win_message = message
+                self._win_text = self.font.render(message, True, (255, 215, 0)).convert_alpha()
+            rect = self._win_text.get_rect(center=(self.screen.get_width() / 2, self.offset_y - 120))
+            self.screen.blit(self._win_text, rect)
 
         self.back_button.draw(self.screen)
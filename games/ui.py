@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import Callable, Tuple
+from typing import Callable, Dict, Tuple
 
 import pygame
 
@@ -11,6 +11,9 @@ from .theme import NEON_BLUE, NEON_PINK
 class Button:
     """Simple neon styled button widget."""
 
+    # Event types handle_event reacts to; callers can skip the call for others.
+    accepts = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN))
+
     def __init__(
         self,
         rect: Tuple[float, float, float, float],
@@ -29,29 +32,55 @@ class Button:
         self.hover_color = hover_color
         self.text_color = text_color
         self.is_hovered = False
+        # The pulse cycles through a few dozen colours; render each only once.
+        self._text_surfaces: Dict[Tuple[str, Tuple[int, ...]], pygame.Surface] = {}
+
+        self._glow_rect = self.rect.inflate(32, 24)
+        self._border_rect = self.rect.inflate(8, 8)
+        self._glow_surfaces = {hovered: self._render_glow(hovered) for hovered in (False, True)}
+        self._body_surfaces = {hovered: self._render_body(hovered) for hovered in (False, True)}
+
+    def _color(self, hovered: bool):
+        return self.hover_color if hovered else self.bg_color
+
+    def _render_glow(self, hovered: bool) -> pygame.Surface:
+        glow_surface = pygame.Surface(self._glow_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(glow_surface, (*self._color(hovered), 80), glow_surface.get_rect(), border_radius=18)
+        return glow_surface.convert_alpha()
+
+    def _render_body(self, hovered: bool) -> pygame.Surface:
+        # Border and inner fill are opaque on the (alpha-less) screen, so they
+        # are drawn opaque here too.
+        body_surface = pygame.Surface(self._border_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(body_surface, self._color(hovered), body_surface.get_rect(), border_radius=16)
+        inner_rect = self.rect.move(-self._border_rect.x, -self._border_rect.y)
+        pygame.draw.rect(body_surface, (15, 15, 30), inner_rect, border_radius=14)
+        return body_surface.convert_alpha()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
+            self.on_motion(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(event.pos):
-                self.callback()
+            self.on_click(event.pos)
 
-    def draw(self, surface: pygame.Surface) -> None:
-        color = self.hover_color if self.is_hovered else self.bg_color
+    def on_motion(self, pos: Tuple[int, int]) -> None:
+        self.is_hovered = self.rect.collidepoint(pos)
 
-        glow_rect = self.rect.inflate(32, 24)
-        glow_surface = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(glow_surface, (*color, 80), glow_surface.get_rect(), border_radius=18)
-        surface.blit(glow_surface, glow_rect.topleft, special_flags=pygame.BLEND_ADD)
+    def on_click(self, pos: Tuple[int, int]) -> None:
+        if self.rect.collidepoint(pos):
+            self.callback()
 
-        border_rect = self.rect.inflate(8, 8)
-        pygame.draw.rect(surface, (*color, 160), border_rect, border_radius=16)
-        pygame.draw.rect(surface, (15, 15, 30), self.rect, border_radius=14)
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.blit(self._glow_surfaces[self.is_hovered], self._glow_rect.topleft, special_flags=pygame.BLEND_ADD)
+        surface.blit(self._body_surfaces[self.is_hovered], self._border_rect.topleft)
 
         pulse = 0.5 + 0.5 * math.sin(pygame.time.get_ticks() / 400.0)
         text_color = tuple(min(255, int(c * (0.7 + 0.3 * pulse))) for c in self.text_color)
-        text_surface = self.font.render(self.text, True, text_color)
+        key = (self.text, text_color)
+        text_surface = self._text_surfaces.get(key)
+        if text_surface is None:
+            text_surface = self.font.render(self.text, True, text_color).convert_alpha()
+            self._text_surfaces[key] = text_surface
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
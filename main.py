@@ -7,10 +7,14 @@ from games.chess import ChessGame
 from games.ludo import LudoGame
 from games.pacman import PacmanGame
 from games.tetris import TetrisGame
-from games.theme import NEON_PINK, draw_neon_background, draw_panel
+from games.theme import NEON_PINK, blit_panel, draw_neon_background, render_panel_text
 from games.tic_tac_toe import TicTacToeGame
 from games.ui import Button
 
+# The only event types any screen reacts to; everything else is dropped by
+# SDL before it reaches the Python event queue.
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION)
+
 
 class StartScreen:
     def __init__(
@@ -28,6 +32,27 @@ class StartScreen:
         self.pulse_time = 0.0
         self._create_buttons()
 
+        self._title_surfaces: dict[tuple[int, ...], pygame.Surface] = {}
+        self._title_shadow = self.title_font.render('80s Arcade Sammlung', True, NEON_PINK).convert_alpha()
+        self._title_rect = self._title_shadow.get_rect(
+            center=(self.screen.get_width() / 2, self.screen.get_height() * 0.18)
+        )
+        self._subtitle = self.font.render('Wähle dein Retro-Abenteuer', True, (235, 245, 255)).convert_alpha()
+        self._subtitle_rect = self._subtitle.get_rect(
+            center=(self.screen.get_width() / 2, self._title_rect.bottom + 50)
+        )
+        self._info_rect = pygame.Rect(
+            self.screen.get_width() * 0.1,
+            self.screen.get_height() * 0.72,
+            self.screen.get_width() * 0.8,
+            160,
+        )
+        self._info_text = render_panel_text(
+            self._info_rect,
+            'Tipps',
+            ['ESC = zurück', 'Vollbild aktiv', 'Alle Spiele lokal spielbar'],
+        )
+
     def _create_buttons(self) -> None:
         labels = [
             ("Tetris", "tetris"),
@@ -51,9 +76,14 @@ class StartScreen:
             self.buttons.append(Button(rect, label, self.font, lambda k=key: self.launch_game(k)))
 
     def handle_events(self, events) -> None:
+        # Check the event type once per event rather than once per button.
         for event in events:
-            for button in self.buttons:
-                button.handle_event(event)
+            if event.type == pygame.MOUSEMOTION:
+                for button in self.buttons:
+                    button.on_motion(event.pos)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                for button in self.buttons:
+                    button.on_click(event.pos)
 
     def update(self, delta: float = 0.0) -> None:
         self.pulse_time = (self.pulse_time + delta) % 1000
@@ -63,31 +93,19 @@ class StartScreen:
         time_ms = pygame.time.get_ticks()
         pulse = 0.6 + 0.4 * pygame.math.Vector2(1, 0).rotate(time_ms / 8).x
         title_color = tuple(int(200 + 55 * pulse) for _ in range(3))
-        title = self.title_font.render('80s Arcade Sammlung', True, title_color)
-        title_rect = title.get_rect(center=(self.screen.get_width() / 2, self.screen.get_height() * 0.18))
-        shadow = self.title_font.render('80s Arcade Sammlung', True, NEON_PINK)
-        self.screen.blit(shadow, title_rect.move(0, 6))
-        self.screen.blit(title, title_rect)
+        title = self._title_surfaces.get(title_color)
+        if title is None:
+            title = self.title_font.render('80s Arcade Sammlung', True, title_color).convert_alpha()
+            self._title_surfaces[title_color] = title
+        self.screen.blit(self._title_shadow, self._title_rect.move(0, 6))
+        self.screen.blit(title, self._title_rect)
 
-        subtitle = self.font.render('Wähle dein Retro-Abenteuer', True, (235, 245, 255))
-        sub_rect = subtitle.get_rect(center=(self.screen.get_width() / 2, title_rect.bottom + 50))
-        self.screen.blit(subtitle, sub_rect)
+        self.screen.blit(self._subtitle, self._subtitle_rect)
 
         for button in self.buttons:
             button.draw(self.screen)
 
-        info_rect = pygame.Rect(
-            self.screen.get_width() * 0.1,
-            self.screen.get_height() * 0.72,
-            self.screen.get_width() * 0.8,
-            160,
-        )
-        draw_panel(
-            self.screen,
-            info_rect,
-            'Tipps',
-            ['ESC = zurück', 'Vollbild aktiv', 'Alle Spiele lokal spielbar'],
-        )
+        blit_panel(self.screen, self._info_rect, self._info_text)
 
 
 
@@ -98,6 +116,8 @@ class GameApp:
         display_info = pygame.display.Info()
         self.screen = pygame.display.set_mode((display_info.current_w, display_info.current_h), pygame.FULLSCREEN)
         pygame.display.set_caption("Arcade Sammlung")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("arial", 42)
         self.title_font = pygame.font.SysFont("arial", 96, bold=True)
@@ -126,7 +146,7 @@ class GameApp:
     def run(self):
         while self.running:
             delta = self.clock.tick(60) / 1000.0
-            events = list(pygame.event.get())
+            events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False